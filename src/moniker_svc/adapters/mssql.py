@@ -97,7 +97,7 @@ class MssqlAdapter(DataAdapter):
         # Add query params as filters
         if moniker.params:
             filters = []
-            for key, value in moniker.params.params.items():
+            for key, value in moniker.params.items:
                 if key not in ("version", "as_of"):  # Reserved params
                     filters.append(f"{key} = '{value}'")
             if filters:
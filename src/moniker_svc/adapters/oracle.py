@@ -83,7 +83,7 @@ class OracleAdapter(DataAdapter):
         # Add query params as filters
         if moniker.params:
             filters = []
-            for key, value in moniker.params.params.items():
+            for key, value in moniker.params.items:
                 if key not in ("version", "as_of"):
                     filters.append(f"{key} = '{value}'")
             if filters:
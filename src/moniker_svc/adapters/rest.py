@@ -68,7 +68,7 @@ class RestApiAdapter(DataAdapter):
         self._apply_auth(headers, binding.config)
 
         # Add query params from moniker
-        params = dict(moniker.params.params) if moniker.params else {}
+        params = dict(moniker.params.items) if moniker.params else {}
 
         try:
             async with httpx.AsyncClient(timeout=timeout) as client:
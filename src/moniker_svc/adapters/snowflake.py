@@ -100,7 +100,7 @@ class SnowflakeAdapter(DataAdapter):
         # Add query params as filters
         if moniker.params:
             filters = []
-            for key, value in moniker.params.params.items():
+            for key, value in moniker.params.items:
                 if key not in ("version", "as_of"):  # Reserved params
                     filters.append(f"{key} = '{value}'")
             if filters:
@@ -116,8 +116,32 @@ class InMemoryCache:
     async def clear(self) -> None:
         """Clear all entries."""
         async with self._lock:
-            self._store.clear()
-            self._access_order.clear()
+            self.clear_nowait()
+
+    def clear_nowait(self) -> None:
+        """
+        Clear all entries without waiting for the lock.
+
+        For synchronous callers on the event loop (e.g. catalog reload).
+        Safe there, since set() never yields between its own updates.
+        """
+        self._store.clear()
+        self._access_order.clear()
+
+    def delete_matching_nowait(self, predicate: Callable[[str], bool]) -> int:
+        """
+        Delete every key for which predicate(key) is true, without the lock.
+
+        Same contract as clear_nowait(). Returns the number of keys deleted.
+        """
+        doomed = [key for key in self._store if predicate(key)]
+        if not doomed:
+            return 0
+        for key in doomed:
+            del self._store[key]
+        doomed_set = set(doomed)
+        self._access_order = [key for key in self._access_order if key not in doomed_set]
+        return len(doomed)
 
     async def get_or_load(
         self,
@@ -175,6 +199,14 @@ class InMemoryCache:
 
         logger.info(f"Cache atomically replaced with {len(entries)} entries")
 
+    def recent_keys(self, prefix: str = "") -> list[str]:
+        """Unexpired keys starting with prefix, most recently set first."""
+        store = self._store
+        return [
+            key for key in reversed(self._access_order)
+            if key.startswith(prefix) and key in store and not store[key].is_expired
+        ]
+
     def _update_access(self, key: str) -> None:
         """Update access order for LRU (caller holds lock)."""
         if key in self._access_order:
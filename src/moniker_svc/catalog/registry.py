@@ -6,7 +6,7 @@ import logging
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Iterator
+from typing import TYPE_CHECKING, Iterable, Iterator
 
 from ..moniker.types import MonikerPath
 from .types import CatalogNode, Ownership, ResolvedOwnership, SourceBinding, NodeStatus, AuditEntry
@@ -103,6 +103,14 @@ class CatalogRegistry:
         with self._lock:
             return path_str in self._nodes
 
+    def exists_many(self, paths: Iterable[str | MonikerPath]) -> list[bool]:
+        """Check several paths under a single lock acquire, in order."""
+        with self._lock:
+            return [
+                (str(p) if isinstance(p, MonikerPath) else p) in self._nodes
+                for p in paths
+            ]
+
     def children(self, path: str | MonikerPath) -> list[CatalogNode]:
         """Get direct children of a path."""
         path_str = str(path) if isinstance(path, MonikerPath) else path
@@ -256,24 +264,46 @@ class CatalogRegistry:
         path_str = str(path) if isinstance(path, MonikerPath) else path
 
         with self._lock:
-            # First check exact match
+            found = self._find_binding(path_str, self._nodes.get(path_str))
+        return (found[0], found[1]) if found else None
+
+    def resolve_bundle(
+        self, path: str | MonikerPath
+    ) -> tuple[CatalogNode | None, tuple[SourceBinding, str, CatalogNode] | None]:
+        """
+        Look up a path's node and its source binding under a single lock.
+
+        Returns (node, binding_info): the node registered at the path (or
+        None), and (binding, binding_path, binding_node) for the binding
+        find_source_binding would return (or None).
+        """
+        path_str = str(path) if isinstance(path, MonikerPath) else path
+
+        with self._lock:
             node = self._nodes.get(path_str)
+            return node, self._find_binding(path_str, node)
+
+    def _find_binding(
+        self, path_str: str, node: CatalogNode | None
+    ) -> tuple[SourceBinding, str, CatalogNode] | None:
+        """Find the binding for path_str, whose node is given. Caller holds the lock."""
+        # First check exact match
+        if node and node.source_binding:
+            # Skip non-resolvable statuses
+            if hasattr(node, 'status') and node.status in (NodeStatus.ARCHIVED, NodeStatus.DRAFT, NodeStatus.PENDING_REVIEW):
+                pass  # Fall through to ancestor check
+            else:
+                return (node.source_binding, path_str, node)
+
+        # Walk up hierarchy
+        for ancestor in reversed(self._ancestor_paths(path_str)):
+            node = self._nodes.get(ancestor)
             if node and node.source_binding:
-                # Skip non-resolvable statuses
                 if hasattr(node, 'status') and node.status in (NodeStatus.ARCHIVED, NodeStatus.DRAFT, NodeStatus.PENDING_REVIEW):
-                    pass  # Fall through to ancestor check
-                else:
-                    return (node.source_binding, path_str)
-
-            # Walk up hierarchy
-            for ancestor in reversed(self._ancestor_paths(path_str)):
-                node = self._nodes.get(ancestor)
-                if node and node.source_binding:
-                    if hasattr(node, 'status') and node.status in (NodeStatus.ARCHIVED, NodeStatus.DRAFT, NodeStatus.PENDING_REVIEW):
-                        continue
-                    return (node.source_binding, ancestor)
+                    continue
+                return (node.source_binding, ancestor, node)
 
-            return None
+        return None
 
     def all_paths(self) -> list[str]:
         """Get all registered paths."""
@@ -335,16 +365,24 @@ class CatalogRegistry:
         """Get all deprecated nodes."""
         return self.find_by_status(NodeStatus.DEPRECATED)
 
-    def update_status(self, path: str, new_status: NodeStatus, actor: str) -> CatalogNode | None:
-        """Update the lifecycle status of a node and log it."""
+    def update_status(
+        self,
+        path: str,
+        new_status: NodeStatus,
+        actor: str,
+        now: str | None = None,
+    ) -> CatalogNode | None:
+        """Update the lifecycle status of a node and log it.
+
+        ``now`` lets callers stamp related records with one timestamp.
+        """
         with self._lock:
             node = self._nodes.get(path)
             if node is None:
                 return None
 
             old_status = node.status
-            from datetime import datetime, timezone
-            now = datetime.now(timezone.utc).isoformat()
+            now = now or datetime.now(timezone.utc).isoformat()
 
             node.status = new_status
             node.updated_at = now
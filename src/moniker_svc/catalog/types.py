@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -233,8 +234,6 @@ class AccessPolicy:
         Returns:
             Tuple of (is_allowed, error_message, estimated_rows)
         """
-        import re
-
         path = "/".join(segments)
         estimated_rows = self.estimate_rows(segments)
 
@@ -31,6 +31,9 @@ class TelemetryConfig:
     # Queue
     max_queue_size: int = 10000
 
+    # Fraction of successful resolution events recorded (failures always are)
+    sample_rate: float = 1.0
+
 
 @dataclass
 class CacheConfig:
@@ -38,6 +41,10 @@ class CacheConfig:
     enabled: bool = True
     max_size: int = 10000
     default_ttl_seconds: float = 300.0
+    # How long "no source binding" results are cached (0 disables)
+    negative_ttl_seconds: float = 30.0
+    # Most recently resolved paths re-resolved after a catalog reload (0 disables)
+    prewarm_max_paths: int = 1000
 
 
 @dataclass
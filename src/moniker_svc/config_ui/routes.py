@@ -81,7 +81,7 @@ def configure(
 def _clear_cache():
     """Clear the service cache if configured."""
     if _service_cache is not None:
-        _service_cache.clear()
+        _service_cache.clear_nowait()
         logger.debug("Cleared service cache after catalog change")
 
 
@@ -472,6 +472,7 @@ async def reload_from_yaml():
 
         # Atomic replace
         catalog.atomic_replace(new_nodes)
+        _clear_cache()
 
         logger.info(f"Reloaded catalog from {source_path} ({len(new_nodes)} nodes)")
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import HTMLResponse
@@ -24,6 +24,9 @@ from .models import (
     ReloadResponse,
 )
 
+if TYPE_CHECKING:
+    from ..service import MonikerService
+
 logger = logging.getLogger(__name__)
 
 # Create router with Domains tag for OpenAPI grouping
@@ -33,12 +36,14 @@ router = APIRouter(prefix="/domains", tags=["Domains"])
 _domain_registry: DomainRegistry | None = None
 _catalog_registry: CatalogRegistry | None = None
 _domains_yaml_path: str = "domains.yaml"
+_service: "MonikerService | None" = None
 
 
 def configure(
     domain_registry: DomainRegistry,
     catalog_registry: Optional[CatalogRegistry] = None,
     domains_yaml_path: str = "domains.yaml",
+    service: "MonikerService | None" = None,
 ) -> None:
     """Configure the Domain routes.
 
@@ -46,11 +51,13 @@ def configure(
         domain_registry: The domain registry to manage
         catalog_registry: Optional catalog registry for linking domains to monikers
         domains_yaml_path: Path to domains YAML file
+        service: Optional moniker service whose cached ownership to invalidate
     """
-    global _domain_registry, _catalog_registry, _domains_yaml_path
+    global _domain_registry, _catalog_registry, _domains_yaml_path, _service
     _domain_registry = domain_registry
     _catalog_registry = catalog_registry
     _domains_yaml_path = domains_yaml_path
+    _service = service
 
 
 def _get_domain_registry() -> DomainRegistry:
@@ -60,6 +67,12 @@ def _get_domain_registry() -> DomainRegistry:
     return _domain_registry
 
 
+def _invalidate_domain(name: str) -> None:
+    """Drop cached views of the paths a domain supplies fallback ownership to."""
+    if _service is not None:
+        _service.invalidate_path(name)
+
+
 def _domain_to_model(domain: Domain) -> DomainModel:
     """Convert Domain dataclass to Pydantic model."""
     return DomainModel(
@@ -183,6 +196,7 @@ async def create_domain(request: CreateDomainRequest):
     )
 
     registry.register(domain)
+    _invalidate_domain(request.name)
     logger.info(f"Created domain: {request.name}")
 
     return _domain_to_model(domain)
@@ -223,6 +237,7 @@ async def update_domain(name: str, request: UpdateDomainRequest):
     )
 
     registry.register_or_update(domain)
+    _invalidate_domain(name)
     logger.info(f"Updated domain: {name}")
 
     return _domain_to_model(domain)
@@ -241,6 +256,7 @@ async def delete_domain(name: str):
         raise HTTPException(status_code=404, detail=f"Domain not found: {name}")
 
     registry.delete(name)
+    _invalidate_domain(name)
     logger.info(f"Deleted domain: {name}")
 
     return {"success": True, "message": f"Domain '{name}' deleted"}
@@ -291,8 +307,13 @@ async def reload_domains():
 
     try:
         # Clear and reload
+        old_names = [domain.name for domain in registry.all_domains()]
         registry.clear()
+        for name in old_names:
+            _invalidate_domain(name)
         domains = load_domains_from_yaml(source_path, registry)
+        for domain in domains:
+            _invalidate_domain(domain.name)
 
         logger.info(f"Reloaded {len(domains)} domains from {source_path}")
 
@@ -53,7 +53,7 @@ from .domains import DomainRegistry, load_domains_from_yaml
 from .models import routes as model_routes
 from .models import ModelRegistry, load_models_from_yaml
 from .requests import routes as request_routes
-from .requests import RequestRegistry, load_requests_from_yaml
+from .requests import RequestRegistry, journal_path, load_requests_from_yaml
 
 
 logger = logging.getLogger(__name__)
@@ -149,6 +149,7 @@ class AccessReport(BaseModel):
     source_type: str | None = None
     row_count: int | None = None
     error_message: str | None = None
+    path: str | None = None  # Path from the /resolve response, if known
 
 
 class HealthResponse(BaseModel):
@@ -949,6 +950,7 @@ async def lifespan(app: FastAPI):
         domain_registry=_domain_registry,
         catalog_registry=catalog,
         domains_yaml_path=domains_yaml_path,
+        service=_service,
     )
     logger.info("Domain configuration enabled")
 
@@ -991,7 +993,7 @@ async def lifespan(app: FastAPI):
     _request_registry = RequestRegistry()
     if config.requests.enabled:
         requests_yaml_path = config.requests.definition_file or os.environ.get("REQUESTS_CONFIG", "requests.yaml")
-        if Path(requests_yaml_path).exists():
+        if Path(requests_yaml_path).exists() or journal_path(requests_yaml_path).exists():
             loaded_reqs = load_requests_from_yaml(requests_yaml_path, _request_registry)
             logger.info(f"Loaded {len(loaded_reqs)} requests from {requests_yaml_path}")
         else:
@@ -1002,7 +1004,9 @@ async def lifespan(app: FastAPI):
             catalog_registry=catalog,
             domain_registry=_domain_registry,
             yaml_path=requests_yaml_path,
+            service=_service,
         )
+        request_routes.start_autosave()
         logger.info("Request & approval workflow enabled")
     else:
         logger.info("Request & approval workflow disabled")
@@ -1089,6 +1093,9 @@ async def lifespan(app: FastAPI):
     if _cache_manager:
         await _cache_manager.stop()
 
+    # Write out request changes still waiting for the next auto-save
+    await request_routes.stop_autosave()
+
     if _redis_cache:
         await _redis_cache.close()
 
@@ -1570,6 +1577,7 @@ async def report_access(
         source_type=report.source_type,
         row_count=report.row_count,
         error_message=report.error_message,
+        moniker_path=report.path,
     )
 
     return {"status": "recorded"}
@@ -1824,6 +1832,7 @@ async def update_catalog_status(
         node.sunset_deadline = body.sunset_deadline
     if body.migration_guide_url is not None:
         node.migration_guide_url = body.migration_guide_url
+    _service.invalidate_path(path)
 
     return {
         "path": path,
@@ -2298,7 +2307,7 @@ async def get_tree(
             return None
 
         # Get name (last segment of path)
-        name = node_path.split("/")[-1] if "/" in node_path else node_path
+        name = node_path.rsplit("/", 1)[-1]
 
         # Get ownership
         ownership = None
@@ -2375,7 +2384,7 @@ async def get_tree_root(
             return None
 
         # Get name (last segment of path)
-        name = node_path.split("/")[-1] if "/" in node_path else node_path
+        name = node_path.rsplit("/", 1)[-1]
 
         # Get ownership
         ownership = None
@@ -41,7 +41,7 @@ class ModelOwnership:
     def from_dict(cls, data: dict) -> "ModelOwnership":
         """Create from dictionary."""
         if not data:
-            return cls()
+            return _EMPTY_MODEL_OWNERSHIP
         return cls(
             methodology_owner=data.get("methodology_owner"),
             business_steward=data.get("business_steward"),
@@ -49,6 +49,10 @@ class ModelOwnership:
         )
 
 
+# Shared instance for models without ownership info
+_EMPTY_MODEL_OWNERSHIP = ModelOwnership()
+
+
 @dataclass(frozen=True, slots=True)
 class MonikerLink:
     """Defines where a model appears in the moniker catalog."""
@@ -78,7 +82,7 @@ class MonikerLink:
         )
 
 
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True, slots=True, eq=False, repr=False)
 class Model:
     """
     A business model representing a measure, metric, or field.
@@ -100,7 +104,7 @@ class Model:
     data_type: str = "float"          # Expected data type
 
     # Governance (no inheritance - each model defines its own)
-    ownership: ModelOwnership = field(default_factory=ModelOwnership)
+    ownership: ModelOwnership = _EMPTY_MODEL_OWNERSHIP
     documentation_url: str | None = None
     methodology_url: str | None = None
 
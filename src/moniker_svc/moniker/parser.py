@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import re
-from urllib.parse import parse_qs, urlparse
+import sys
+from urllib.parse import parse_qs
 
-from .types import Moniker, MonikerPath, QueryParams, VersionType
+from .types import MONIKER_SCHEME, Moniker, MonikerPath, QueryParams, VersionType
 
 
 class MonikerParseError(ValueError):
@@ -17,6 +18,12 @@ class MonikerParseError(ValueError):
 # Must start with alphanumeric
 SEGMENT_PATTERN = re.compile(r"^[a-zA-Z0-9][a-zA-Z0-9_.\-]*$")
 
+# Sub-resource pattern: dot-separated segments (details.corporate.actions), each
+# starting with alphanumeric and at most 128 characters long
+SUB_RESOURCE_PATTERN = re.compile(
+    r"[a-zA-Z0-9][a-zA-Z0-9_\-]{0,127}(?:\.[a-zA-Z0-9][a-zA-Z0-9_\-]{0,127})*"
+)
+
 # Namespace pattern: alphanumeric, hyphens, underscores (no dots - those are for paths)
 NAMESPACE_PATTERN = re.compile(r"^[a-zA-Z][a-zA-Z0-9_\-]*$")
 
@@ -26,11 +33,24 @@ VERSION_PATTERN = re.compile(r"^[a-zA-Z0-9]+$")
 # Revision pattern: /vN or /VN where N is a positive integer (case-insensitive)
 REVISION_PATTERN = re.compile(r"^[vV](\d+)$")
 
+# A foreign scheme ("http://", "s3://", ...) at the start of the moniker.
+# Anchored, so "://" elsewhere (e.g. a URL in a query param) is not a scheme
+_FOREIGN_SCHEME_RE = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://")
+
+_SCHEME_LEN = len(MONIKER_SCHEME)
+
 # Version classification patterns
 DATE_VERSION_PATTERN = re.compile(r"^\d{8}$")                  # 20260101 (YYYYMMDD)
 LOOKBACK_VERSION_PATTERN = re.compile(r"^\d+[YMWD]$", re.I)    # 3M, 12Y, 1W, 5D
-FREQUENCY_VERSION_PATTERN = re.compile(r"^(daily|weekly|monthly)$", re.I)
-KEYWORD_VERSION_PATTERN = re.compile(r"^(latest|all)$", re.I)
+
+# Non-numeric versions with a fixed meaning (matched case-insensitively)
+KEYWORD_VERSION_TYPES: dict[str, VersionType] = {
+    "latest": VersionType.LATEST,
+    "all": VersionType.ALL,
+    "daily": VersionType.FREQUENCY,
+    "weekly": VersionType.FREQUENCY,
+    "monthly": VersionType.FREQUENCY,
+}
 
 # Backward compatibility alias
 TENOR_VERSION_PATTERN = LOOKBACK_VERSION_PATTERN
@@ -47,15 +67,15 @@ def classify_version(version: str | None) -> VersionType | None:
     """
     if not version:
         return None
-    if DATE_VERSION_PATTERN.match(version):
-        return VersionType.DATE
-    if LOOKBACK_VERSION_PATTERN.match(version):
-        return VersionType.LOOKBACK
-    if FREQUENCY_VERSION_PATTERN.match(version):
-        return VersionType.FREQUENCY
-    if KEYWORD_VERSION_PATTERN.match(version):
-        return VersionType.LATEST if version.lower() == "latest" else VersionType.ALL
-    return VersionType.CUSTOM
+    # The first character decides which family the version can belong to:
+    # digits are dates or lookbacks, anything else is a keyword or custom.
+    if version[0].isdecimal():
+        if len(version) == 8 and version.isdecimal():
+            return VersionType.DATE
+        if LOOKBACK_VERSION_PATTERN.match(version):
+            return VersionType.LOOKBACK
+        return VersionType.CUSTOM
+    return KEYWORD_VERSION_TYPES.get(version.lower(), VersionType.CUSTOM)
 
 
 def validate_segment(segment: str) -> bool:
@@ -109,7 +129,9 @@ def parse_path(path_str: str, *, validate: bool = True) -> MonikerPath:
                     "alphanumerics, hyphens, underscores, or dots."
                 )
 
-    return MonikerPath(tuple(segments))
+    # Intern segments: the same few names recur across every moniker, and
+    # interned strings let path comparisons short-circuit on identity
+    return MonikerPath(tuple(map(sys.intern, segments)))
 
 
 def parse_moniker(moniker_str: str, *, validate: bool = True) -> Moniker:
@@ -145,22 +167,20 @@ def parse_moniker(moniker_str: str, *, validate: bool = True) -> Moniker:
     moniker_str = moniker_str.strip()
 
     # Handle scheme
-    if moniker_str.startswith("moniker://"):
-        # Parse as URL
-        parsed = urlparse(moniker_str)
-        body = parsed.netloc + parsed.path
-        query_str = parsed.query
-    elif "://" in moniker_str:
+    if moniker_str.startswith(MONIKER_SCHEME):
+        # Strip the scheme and any #fragment (ignored, as a URL parser would)
+        rest = moniker_str[_SCHEME_LEN:]
+        hash_idx = rest.find("#")
+        if hash_idx != -1:
+            rest = rest[:hash_idx]
+        body, _, query_str = rest.partition("?")
+    elif _FOREIGN_SCHEME_RE.match(moniker_str):
         raise MonikerParseError(
             f"Invalid scheme. Expected 'moniker://' or no scheme, got: {moniker_str}"
         )
     else:
         # No scheme - check for query string
-        if "?" in moniker_str:
-            body, query_str = moniker_str.split("?", 1)
-        else:
-            body = moniker_str
-            query_str = ""
+        body, _, query_str = moniker_str.partition("?")
 
     # Parse namespace (prefix before first @, but only if @ appears before first /)
     namespace = None
@@ -185,20 +205,14 @@ def parse_moniker(moniker_str: str, *, validate: bool = True) -> Moniker:
 
     # Parse revision suffix (/vN or /VN at the end - case-insensitive)
     revision = None
-    # Check for both /v and /V patterns
-    remaining_lower = remaining.lower()
-    if "/v" in remaining_lower:
-        # Find the last /v or /V pattern
-        # Use case-insensitive search by finding the rightmost occurrence
-        lower_idx = remaining_lower.rfind("/v")
-        if lower_idx != -1:
-            before = remaining[:lower_idx]
-            after = remaining[lower_idx + 2:]  # Skip the "/v" or "/V"
-            # Check if it's a valid revision (just digits at the end or before ?)
-            rev_match = re.match(r"^(\d+)(?:$|(?=\?))", after)
-            if rev_match:
-                revision = int(rev_match.group(1))
-                remaining = before
+    # Find the rightmost /v or /V without building a lowercased copy
+    rev_idx = max(remaining.rfind("/v"), remaining.rfind("/V"))
+    if rev_idx != -1:
+        after = remaining[rev_idx + 2:]  # Skip the "/v" or "/V"
+        # The query string is already split off, so a revision is just digits
+        if after.isdecimal():
+            revision = int(after)
+            remaining = remaining[:rev_idx]
 
     # Parse version suffix with optional sub-resource: @version[/sub.resource]
     # Examples:
@@ -207,57 +221,44 @@ def parse_moniker(moniker_str: str, *, validate: bool = True) -> Moniker:
     #   securities/012345678@20260101/details.corporate.actions -> sub_resource=details.corporate.actions
     version = None
     sub_resource = None
-    if "@" in remaining:
-        # Find the @ that's a version (not a namespace prefix)
-        # Namespace @ appears before any /
-        first_slash_in_remaining = remaining.find("/")
-        at_idx = remaining.rfind("@")
-
-        # Check if this @ is after the first slash (making it a version, not namespace)
-        # If no slash in remaining, check if we already parsed namespace
-        is_version_at = (first_slash_in_remaining != -1 and at_idx > first_slash_in_remaining) or \
-                        (first_slash_in_remaining == -1 and namespace is not None) or \
-                        (first_slash_in_remaining == -1 and at_idx == remaining.find("@"))
-
-        # Actually, simpler: if namespace was already parsed, any @ is a version
-        # If namespace wasn't parsed, @ is version only if it's after a /
-        if namespace is not None:
-            # Namespace already extracted, any @ is a version
-            is_version_at = at_idx != -1
+    # The namespace "@" (if any) has been consumed and is only recognised before
+    # the first "/", so any "@" still in `remaining` marks the version. If the
+    # body had no "@" at all there is nothing left to look for.
+    at_idx = remaining.rfind("@") if first_at != -1 else -1
+    if at_idx != -1:
+        # Everything before @ is the path
+        path_part = remaining[:at_idx]
+        after_at = remaining[at_idx + 1:]
+
+        # Check if there's a sub-resource (path after version)
+        # Pattern: @version/sub.resource or just @version
+        slash_idx = after_at.find("/")
+        if slash_idx != -1:
+            version = after_at[:slash_idx]
+            sub_resource = after_at[slash_idx + 1:]
         else:
-            # No namespace yet - @ is version only if after first /
-            is_version_at = at_idx != -1 and (first_slash_in_remaining == -1 or at_idx > first_slash_in_remaining)
-
-        if is_version_at and at_idx != -1:
-            # Everything before @ is the path
-            path_part = remaining[:at_idx]
-            after_at = remaining[at_idx + 1:]
-
-            # Check if there's a sub-resource (path after version)
-            # Pattern: @version/sub.resource or just @version
-            if "/" in after_at:
-                version, sub_resource = after_at.split("/", 1)
-            else:
-                version = after_at
+            version = after_at
 
-            remaining = path_part
+        remaining = path_part
 
-            if validate and version and not VERSION_PATTERN.match(version):
-                raise MonikerParseError(
-                    f"Invalid version: '{version}'. "
-                    "Version must be alphanumeric (e.g., 'latest', '20260115', '3M')."
-                )
+        if validate and version and not VERSION_PATTERN.match(version):
+            raise MonikerParseError(
+                f"Invalid version: '{version}'. "
+                "Version must be alphanumeric (e.g., 'latest', '20260115', '3M')."
+            )
 
-            # Validate sub_resource segments if present
-            if validate and sub_resource:
-                # Sub-resource uses dots for multi-level: details.corporate.actions
-                # Each dot-separated part should be a valid segment
-                for part in sub_resource.split("."):
-                    if not validate_segment(part):
-                        raise MonikerParseError(
-                            f"Invalid sub-resource segment: '{part}'. "
-                            "Sub-resource parts must start with alphanumeric."
-                        )
+        # Validate sub_resource segments if present
+        if validate and sub_resource and not SUB_RESOURCE_PATTERN.fullmatch(sub_resource):
+            # Sub-resource uses dots for multi-level: details.corporate.actions
+            # Only split it up on the error path, to name the offending part
+            part = next(
+                (p for p in sub_resource.split(".") if not validate_segment(p)),
+                sub_resource,
+            )
+            raise MonikerParseError(
+                f"Invalid sub-resource segment: '{part}'. "
+                "Sub-resource parts must start with alphanumeric."
+            )
 
     # Parse path
     path = parse_path(remaining, validate=validate)
@@ -278,7 +279,7 @@ def parse_moniker(moniker_str: str, *, validate: bool = True) -> Moniker:
         version_type=classify_version(version),
         sub_resource=sub_resource,
         revision=revision,
-        params=QueryParams(params),
+        params=QueryParams.from_dict(params),
     )
 
 
@@ -327,5 +328,5 @@ def build_moniker(
         version_type=effective_version_type,
         sub_resource=sub_resource,
         revision=revision,
-        params=QueryParams(params) if params else QueryParams({}),
+        params=QueryParams.from_dict(params),
     )
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-import re
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, Iterator
+from urllib.parse import quote, urlencode
+
+
+# URI scheme prefix used in the canonical string form of a moniker
+MONIKER_SCHEME = "moniker://"
 
 
 class VersionType(Enum):
@@ -46,8 +51,42 @@ class MonikerPath:
     """
     segments: tuple[str, ...]
 
+    # Computed on first use; paths are immutable and heavily used as keys.
+    # The slots stay unset until then, so construction doesn't pay for them.
+    _str: str = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _hierarchy: tuple[str, ...] = field(init=False, repr=False, compare=False)
+
     def __str__(self) -> str:
-        return "/".join(self.segments)
+        try:
+            return self._str
+        except AttributeError:
+            result = "/".join(self.segments)
+            object.__setattr__(self, "_str", result)
+            return result
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            result = hash(self.segments)
+            object.__setattr__(self, "_hash", result)
+            return result
+
+    @property
+    def hierarchy(self) -> tuple[str, ...]:
+        """The root (""), each ancestor and this path, as strings."""
+        try:
+            return self._hierarchy
+        except AttributeError:
+            segments = self.segments
+            result = ("", *("/".join(segments[:i]) for i in range(1, len(segments))), str(self))
+            object.__setattr__(self, "_hierarchy", result)
+            return result
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickle only the segments: string hashes differ between processes
+        return (MonikerPath, (self.segments,))
 
     def __len__(self) -> int:
         return len(self.segments)
@@ -74,10 +113,16 @@ class MonikerPath:
 
     def ancestors(self) -> list[MonikerPath]:
         """All ancestor paths from root to parent (not including self)."""
-        result = []
-        for i in range(1, len(self.segments)):
-            result.append(MonikerPath(self.segments[:i]))
-        return result
+        return list(self.iter_ancestors())
+
+    def iter_ancestors(self) -> Iterator[MonikerPath]:
+        """Lazily yield ancestor paths from root to parent (not including self).
+
+        Prefer this over ancestors() when the caller may stop early.
+        """
+        segments = self.segments
+        for i in range(1, len(segments)):
+            yield MonikerPath(segments[:i])
 
     def child(self, segment: str) -> MonikerPath:
         """Create a child path."""
@@ -85,9 +130,10 @@ class MonikerPath:
 
     def is_ancestor_of(self, other: MonikerPath) -> bool:
         """Check if this path is an ancestor of another."""
-        if len(self.segments) >= len(other.segments):
-            return False
-        return other.segments[:len(self.segments)] == self.segments
+        # Segments are interned when parsed, so the tuple comparison below
+        # mostly resolves on identity rather than character comparison
+        n = len(self.segments)
+        return n < len(other.segments) and other.segments[:n] == self.segments
 
     def is_descendant_of(self, other: MonikerPath) -> bool:
         """Check if this path is a descendant of another."""
@@ -104,23 +150,52 @@ class MonikerPath:
         if not path_str or path_str == "/":
             return cls.root()
         # Strip leading/trailing slashes and split
-        segments = tuple(s for s in path_str.strip("/").split("/") if s)
+        segments = tuple(sys.intern(s) for s in path_str.strip("/").split("/") if s)
         return cls(segments)
 
 
 @dataclass(frozen=True, slots=True)
 class QueryParams:
-    """Query parameters on a moniker."""
-    params: dict[str, str] = field(default_factory=dict)
+    """
+    Query parameters on a moniker.
+
+    Stored as (key, value) pairs sorted by key, so equal parameter sets
+    compare and hash equal and stringify in canonical order. Monikers
+    rarely carry more than a handful of params, so lookups scan the pairs.
+    """
+    items: tuple[tuple[str, str], ...] = ()
 
     def get(self, key: str, default: str | None = None) -> str | None:
-        return self.params.get(key, default)
+        for k, v in self.items:
+            if k == key:
+                return v
+        return default
 
     def __contains__(self, key: str) -> bool:
-        return key in self.params
+        for k, _ in self.items:
+            if k == key:
+                return True
+        return False
 
     def __bool__(self) -> bool:
-        return bool(self.params)
+        return bool(self.items)
+
+    @property
+    def params(self) -> dict[str, str]:
+        """Backward compatibility: the parameters as a dict."""
+        return dict(self.items)
+
+    @classmethod
+    def from_dict(cls, params: dict[str, str]) -> QueryParams:
+        """Create from a dict of parameters, sorting them by key."""
+        if not params:
+            return _EMPTY_QUERY_PARAMS
+        return cls(tuple(sorted(params.items())))
+
+
+# Shared instance for monikers without query params (QueryParams is frozen and
+# never mutated, so one empty instance can stand in for all of them)
+_EMPTY_QUERY_PARAMS = QueryParams()
 
 
 @dataclass(frozen=True, slots=True)
@@ -156,38 +231,42 @@ class Moniker:
     version_type: VersionType | None = None  # Semantic type of version
     sub_resource: str | None = None  # Path after @version (e.g., "details.corporate.actions")
     revision: int | None = None  # /v2 -> 2
-    params: QueryParams = field(default_factory=lambda: QueryParams({}))
+    params: QueryParams = _EMPTY_QUERY_PARAMS
+
+    # String forms, computed on first use (the instance is immutable). The
+    # slots stay unset until then, so construction doesn't pay for them.
+    _str: str = field(init=False, repr=False, compare=False)
+    _full_path: str = field(init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
-        parts = []
+        try:
+            return self._str
+        except AttributeError:
+            pass
 
-        # Namespace prefix
+        # Namespace prefix, then path/version/sub-resource/revision
         if self.namespace:
-            parts.append(f"{self.namespace}@")
-
-        # Path
-        parts.append(str(self.path))
-
-        # Version suffix
-        if self.version:
-            parts.append(f"@{self.version}")
-
-        # Sub-resource (after version, before revision)
-        if self.sub_resource:
-            parts.append(f"/{self.sub_resource}")
-
-        # Revision suffix
-        if self.revision is not None:
-            parts.append(f"/v{self.revision}")
+            base = self.namespace + "@" + self.full_path
+        else:
+            base = self.full_path
 
-        base = "".join(parts)
-
-        # Query params
+        # Query params, percent-encoded so values containing "&", "=", "#" or
+        # spaces survive a round trip ("/" and ":" stay readable, e.g. URLs)
         if self.params:
-            param_str = "&".join(f"{k}={v}" for k, v in self.params.params.items())
-            return f"moniker://{base}?{param_str}"
+            param_str = urlencode(self.params.items, safe="/:", quote_via=quote)
+            result = MONIKER_SCHEME + base + "?" + param_str
+        else:
+            result = MONIKER_SCHEME + base
+
+        object.__setattr__(self, "_str", result)
+        return result
 
-        return f"moniker://{base}"
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild from the public fields; the cache slots may be unset
+        return (Moniker, (
+            self.path, self.namespace, self.version, self.version_type,
+            self.sub_resource, self.revision, self.params,
+        ))
 
     @property
     def domain(self) -> str | None:
@@ -202,6 +281,10 @@ class Moniker:
     @property
     def full_path(self) -> str:
         """Path including version, sub-resource, and revision but not namespace."""
+        try:
+            return self._full_path
+        except AttributeError:
+            pass
         parts = [str(self.path)]
         if self.version:
             parts.append(f"@{self.version}")
@@ -209,7 +292,9 @@ class Moniker:
             parts.append(f"/{self.sub_resource}")
         if self.revision is not None:
             parts.append(f"/v{self.revision}")
-        return "".join(parts)
+        result = "".join(parts)
+        object.__setattr__(self, "_full_path", result)
+        return result
 
     @property
     def is_versioned(self) -> bool:
@@ -239,9 +324,11 @@ class Moniker:
             Tuple of (value, unit) where unit is Y/M/W/D, or None if not a lookback.
         """
         if self.version_type == VersionType.LOOKBACK and self.version:
-            match = re.match(r"^(\d+)([YMWD])$", self.version, re.IGNORECASE)
-            if match:
-                return (int(match.group(1)), match.group(2).upper())
+            # Plain string checks: <digits><unit>, e.g. "3M" or "12y"
+            unit = self.version[-1].upper()
+            num = self.version[:-1]
+            if unit in "YMWD" and num.isdecimal():
+                return (int(num), unit)
         return None
 
     @property
@@ -267,6 +354,8 @@ class Moniker:
 
     def with_version(self, version: str, version_type: VersionType | None = None) -> Moniker:
         """Create a copy with a different version."""
+        if version == self.version and version_type == self.version_type:
+            return self  # Immutable, so an unchanged copy can be this instance
         return Moniker(
             path=self.path,
             namespace=self.namespace,
@@ -279,6 +368,8 @@ class Moniker:
 
     def with_namespace(self, namespace: str | None) -> Moniker:
         """Create a copy with a different namespace."""
+        if namespace == self.namespace:
+            return self
         return Moniker(
             path=self.path,
             namespace=namespace,
@@ -291,6 +382,8 @@ class Moniker:
 
     def with_sub_resource(self, sub_resource: str | None) -> Moniker:
         """Create a copy with a different sub-resource."""
+        if sub_resource == self.sub_resource:
+            return self
         return Moniker(
             path=self.path,
             namespace=self.namespace,
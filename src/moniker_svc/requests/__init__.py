@@ -14,7 +14,14 @@ from .types import (
     MonikerRequest,
 )
 from .registry import RequestRegistry
-from .loader import load_requests_from_yaml, save_requests_to_yaml
+from .loader import (
+    append_request_to_journal,
+    journal_path,
+    load_requests_from_yaml,
+    read_requests_from_yaml,
+    save_requests_to_yaml,
+)
+from .save_context import AsyncSaveContext
 
 __all__ = [
     "RequestStatus",
@@ -24,5 +31,9 @@ __all__ = [
     "MonikerRequest",
     "RequestRegistry",
     "load_requests_from_yaml",
+    "read_requests_from_yaml",
     "save_requests_to_yaml",
+    "append_request_to_journal",
+    "journal_path",
+    "AsyncSaveContext",
 ]
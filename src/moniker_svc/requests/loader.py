@@ -1,12 +1,41 @@
-"""Request persistence - YAML round-trip for moniker requests."""
+"""Request persistence - YAML round-trip for moniker requests.
+
+The YAML file is a snapshot. Individual mutations are appended to a JSON
+Lines journal next to it (``<file>.journal``), one request state per line,
+so a single update does not rewrite every request. Loading replays the
+journal over the snapshot; saving a full snapshot truncates the journal.
+"""
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
 import yaml
+from pydantic import TypeAdapter, ValidationError
+
+# Prefer the libyaml-backed C implementations when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as _SafeDumper, CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper, SafeLoader as _SafeLoader
+
+# orjson is optional; the journal format is plain JSON either way
+try:
+    import orjson
+
+    def _json_line(data: dict[str, Any]) -> bytes:
+        return orjson.dumps(data) + b"\n"
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_line(data: dict[str, Any]) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8") + b"\n"
+
+    _json_loads = json.loads
 
 from .registry import RequestRegistry
 from .types import (
@@ -19,51 +48,160 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Validates whole batches of request records straight into MonikerRequest
+# (and its nested dataclasses) in pydantic-core
+_REQUESTS_ADAPTER: TypeAdapter[list[MonikerRequest]] = TypeAdapter(list[MonikerRequest])
+
+# Plain dict lookups for the lenient parser, instead of Enum calls that
+# raise on unknown values
+_STATUS_BY_VALUE: dict[str, RequestStatus] = {s.value: s for s in RequestStatus}
+_DOMAIN_LEVEL_BY_VALUE: dict[str, DomainLevel] = {d.value: d for d in DomainLevel}
+
+
+def journal_path(path: str | Path) -> Path:
+    """Path of the append-only journal that accompanies a requests YAML file."""
+    path = Path(path)
+    return path.with_name(path.name + ".journal")
+
 
 def load_requests_from_yaml(
     path: str | Path,
     registry: RequestRegistry,
 ) -> list[MonikerRequest]:
-    """Load requests from a YAML file into the registry."""
+    """Load requests from a YAML file (plus its journal) into the registry."""
+    loaded = read_requests_from_yaml(path)
+    if not loaded:
+        return []
+
+    registry.submit_many(loaded)
+
+    logger.info(f"Loaded {len(loaded)} requests from {path}")
+    return loaded
+
+
+def read_requests_from_yaml(path: str | Path) -> list[MonikerRequest]:
+    """Read and parse requests from a YAML file (plus its journal).
+
+    Touches no registry, so it can run in a worker thread.
+    """
     path = Path(path)
-    if not path.exists():
+    journal = journal_path(path)
+    if not path.exists() and not journal.exists():
         logger.info(f"Requests file not found: {path}")
         return []
 
-    with open(path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    data = None
+    if path.exists():
+        # Binary mode: the loader detects and decodes UTF-8 itself (in C with
+        # libyaml), so skip a separate text-decoding pass
+        with open(path, "rb") as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+
+    # Later states of the same request replace earlier ones
+    by_id: dict[str, dict[str, Any]] = {}
+    if data and "requests" in data:
+        for req_data in data["requests"]:
+            by_id[req_data.get("request_id", "")] = req_data
+    if journal.exists():
+        _replay_journal(journal, by_id)
 
-    if not data or "requests" not in data:
+    if not by_id:
         return []
 
-    loaded = []
-    for req_data in data["requests"]:
-        request = _parse_request(req_data)
-        registry.submit(request)
-        loaded.append(request)
+    return _parse_requests(list(by_id.values()))
 
-    logger.info(f"Loaded {len(loaded)} requests from {path}")
-    return loaded
+
+def _replay_journal(journal: Path, by_id: dict[str, dict[str, Any]]) -> None:
+    """Apply journal entries in order on top of the snapshot records."""
+    with open(journal, "rb") as f:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                req_data = _json_loads(line)
+            except ValueError:
+                # A torn final write after a crash - skip it
+                logger.warning(f"Skipping malformed journal line {line_no} in {journal}")
+                continue
+            by_id[req_data.get("request_id", "")] = req_data
+
+
+def append_request_to_journal(
+    path: str | Path,
+    request: MonikerRequest,
+) -> None:
+    """Append the current state of one request to the journal for a YAML file."""
+    append_journal_entries(path, encode_journal_entries([request]))
+
+
+def encode_journal_entries(requests: Iterable[MonikerRequest]) -> bytes:
+    """Serialize requests to journal lines (one JSON object per line)."""
+    return b"".join(_json_line(_serialize_request(r)) for r in requests)
+
+
+def append_journal_entries(path: str | Path, data: bytes) -> None:
+    """Append pre-encoded journal lines to the journal for a YAML file."""
+    journal = journal_path(path)
+    journal.parent.mkdir(parents=True, exist_ok=True)
+    with open(journal, "ab") as f:
+        f.write(data)
 
 
 def save_requests_to_yaml(
     path: str | Path,
     registry: RequestRegistry,
 ) -> int:
-    """Save all requests from the registry to a YAML file."""
-    path = Path(path)
-    requests = registry.all_requests()
+    """Save all requests from the registry to a YAML file and truncate its journal."""
+    records = serialize_requests(registry.all_requests())
+    write_requests_yaml(path, records)
 
-    data: dict[str, Any] = {
-        "requests": [_serialize_request(r) for r in requests],
-    }
+    logger.info(f"Saved {len(records)} requests to {path}")
+    return len(records)
+
+
+def serialize_requests(requests: Iterable[MonikerRequest]) -> list[dict[str, Any]]:
+    """Serialize requests to the plain records stored in the YAML snapshot."""
+    return [_serialize_request(r) for r in requests]
+
+
+def write_requests_yaml(path: str | Path, records: list[dict[str, Any]]) -> None:
+    """Write serialized request records as the YAML snapshot and truncate its journal.
+
+    Works on already-serialized records, so it can run in a worker thread
+    while the requests themselves keep changing.
+    """
+    path = Path(path)
+    data: dict[str, Any] = {"requests": records}
 
     path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        yaml.dump(data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    # Write to a temporary file and rename it over the snapshot, so a crash
+    # mid-write never leaves a truncated snapshot next to the journal
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        yaml.dump(
+            data, f,
+            Dumper=_SafeDumper,
+            default_flow_style=False,
+            allow_unicode=True,
+            sort_keys=False,
+        )
+    os.replace(tmp_path, path)
+
+    # The snapshot now includes every journaled change
+    journal_path(path).unlink(missing_ok=True)
+
+
+def _parse_requests(records: list[dict[str, Any]]) -> list[MonikerRequest]:
+    """Parse request records, validating the whole batch at once when possible.
 
-    logger.info(f"Saved {len(requests)} requests to {path}")
-    return len(requests)
+    Records that don't strictly match the dataclass types (unknown status
+    values, missing requester fields, ...) make the batch fall back to the
+    lenient per-record parser, which substitutes defaults.
+    """
+    try:
+        return _REQUESTS_ADAPTER.validate_python(records)
+    except ValidationError:
+        return [_parse_request(r) for r in records]
 
 
 def _parse_request(data: dict[str, Any]) -> MonikerRequest:
@@ -88,19 +226,9 @@ def _parse_request(data: dict[str, Any]) -> MonikerRequest:
             action=c.get("action", "comment"),
         ))
 
-    status = RequestStatus.PENDING_REVIEW
-    if "status" in data:
-        try:
-            status = RequestStatus(data["status"])
-        except ValueError:
-            pass
-
-    domain_level = DomainLevel.SUB_PATH
-    if "domain_level" in data:
-        try:
-            domain_level = DomainLevel(data["domain_level"])
-        except ValueError:
-            pass
+    # Unknown or missing values fall back to the defaults
+    status = _STATUS_BY_VALUE.get(data.get("status"), RequestStatus.PENDING_REVIEW)
+    domain_level = _DOMAIN_LEVEL_BY_VALUE.get(data.get("domain_level"), DomainLevel.SUB_PATH)
 
     return MonikerRequest(
         request_id=data.get("request_id", ""),
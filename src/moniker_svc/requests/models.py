@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 # =============================================================================
@@ -44,6 +44,15 @@ class SubmitRequestBody(BaseModel):
     # Tags
     tags: list[str] = Field(default_factory=list)
 
+    @field_validator("path")
+    @classmethod
+    def _normalize_path(cls, v: str) -> str:
+        """Strip whitespace and surrounding slashes; reject empty paths."""
+        v = v.strip().strip("/")
+        if not v:
+            raise ValueError("Path cannot be empty")
+        return v
+
 
 class ReviewActionBody(BaseModel):
     """Body for approve/reject actions."""
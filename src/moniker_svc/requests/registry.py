@@ -21,8 +21,35 @@ class RequestRegistry:
     def __init__(self) -> None:
         self._requests: dict[str, MonikerRequest] = {}
         self._path_index: dict[str, str] = {}  # path -> request_id
-        self._lock = threading.RLock()
+        # status -> {request_id: request}, in the order requests reached that status
+        self._status_index: dict[RequestStatus, dict[str, MonikerRequest]] = {
+            status: {} for status in RequestStatus
+        }
+        self._pending_paths: dict[str, int] = {}  # path -> number of pending requests
+        self._lock = threading.Lock()  # not re-entrant: locked methods never call each other
         self._counter = 0
+        self._version = 0  # last version stamped on a request; never reset
+
+    def _touch(self, request: MonikerRequest) -> None:
+        """Stamp a request with a new registry-unique version. Caller must hold the lock."""
+        self._version += 1
+        request.version = self._version
+
+    def _index(self, request: MonikerRequest) -> None:
+        """Add a request to the status indexes. Caller must hold the lock."""
+        self._status_index[request.status][request.request_id] = request
+        if request.status == RequestStatus.PENDING_REVIEW:
+            self._pending_paths[request.path] = self._pending_paths.get(request.path, 0) + 1
+
+    def _unindex(self, request: MonikerRequest) -> None:
+        """Remove a request from the status indexes. Caller must hold the lock."""
+        self._status_index[request.status].pop(request.request_id, None)
+        if request.status == RequestStatus.PENDING_REVIEW:
+            remaining = self._pending_paths.get(request.path, 0) - 1
+            if remaining > 0:
+                self._pending_paths[request.path] = remaining
+            else:
+                self._pending_paths.pop(request.path, None)
 
     def _next_id(self) -> str:
         """Generate the next request ID."""
@@ -37,11 +64,39 @@ class RequestRegistry:
             now = datetime.now(timezone.utc).isoformat()
             request.created_at = now
             request.updated_at = now
+            self._touch(request)
+            previous = self._requests.get(request.request_id)
+            if previous is not None:
+                self._unindex(previous)
             self._requests[request.request_id] = request
             self._path_index[request.path] = request.request_id
+            self._index(request)
             logger.info(f"Request submitted: {request.request_id} for path {request.path}")
             return request
 
+    def submit_many(self, requests: list[MonikerRequest]) -> list[MonikerRequest]:
+        """Submit several requests at once, e.g. when loading from disk.
+
+        Unlike submit(), existing timestamps are kept so reloaded requests
+        retain their history; only missing ones are set to now.
+        """
+        with self._lock:
+            now = datetime.now(timezone.utc).isoformat()
+            for request in requests:
+                if not request.request_id:
+                    request.request_id = self._next_id()
+                request.created_at = request.created_at or now
+                request.updated_at = request.updated_at or now
+                self._touch(request)
+                previous = self._requests.get(request.request_id)
+                if previous is not None:
+                    self._unindex(previous)
+                self._requests[request.request_id] = request
+                self._path_index[request.path] = request.request_id
+                self._index(request)
+            logger.info(f"Submitted {len(requests)} requests")
+            return requests
+
     def get(self, request_id: str) -> MonikerRequest | None:
         """Get a request by ID."""
         with self._lock:
@@ -58,15 +113,12 @@ class RequestRegistry:
     def path_has_pending_request(self, path: str) -> bool:
         """Check if there's already a pending request for this path."""
         with self._lock:
-            for req in self._requests.values():
-                if req.path == path and req.status == RequestStatus.PENDING_REVIEW:
-                    return True
-            return False
+            return path in self._pending_paths
 
     def find_by_status(self, status: RequestStatus) -> list[MonikerRequest]:
         """Get all requests with a given status."""
         with self._lock:
-            return [r for r in self._requests.values() if r.status == status]
+            return list(self._status_index[status].values())
 
     def update_status(
         self,
@@ -74,16 +126,23 @@ class RequestRegistry:
         new_status: RequestStatus,
         actor: str | None = None,
         reason: str | None = None,
+        now: str | None = None,
     ) -> MonikerRequest | None:
-        """Update the status of a request."""
+        """Update the status of a request.
+
+        ``now`` lets callers stamp related records with one timestamp.
+        """
         with self._lock:
             request = self._requests.get(request_id)
             if request is None:
                 return None
 
-            now = datetime.now(timezone.utc).isoformat()
+            now = now or datetime.now(timezone.utc).isoformat()
+            self._unindex(request)
             request.status = new_status
+            self._index(request)
             request.updated_at = now
+            self._touch(request)
 
             if actor:
                 request.reviewed_by = actor
@@ -99,6 +158,7 @@ class RequestRegistry:
         self,
         request_id: str,
         comment: ReviewComment,
+        now: str | None = None,
     ) -> MonikerRequest | None:
         """Add a review comment to a request."""
         with self._lock:
@@ -107,21 +167,28 @@ class RequestRegistry:
                 return None
 
             request.comments.append(comment)
-            request.updated_at = datetime.now(timezone.utc).isoformat()
+            request.updated_at = now or datetime.now(timezone.utc).isoformat()
+            self._touch(request)
             return request
 
     def count_by_status(self) -> dict[str, int]:
         """Get counts of requests grouped by status."""
         with self._lock:
-            counts: dict[str, int] = {}
-            for req in self._requests.values():
-                key = req.status.value
-                counts[key] = counts.get(key, 0) + 1
+            # The status index already tracks each bucket's size
+            counts = {
+                status.value: len(by_id)
+                for status, by_id in self._status_index.items()
+                if by_id
+            }
             counts["total"] = len(self._requests)
             return counts
 
     def all_requests(self) -> list[MonikerRequest]:
-        """Get all requests."""
+        """Get all requests.
+
+        Returns a new list (a single C-level copy taken under the lock) that
+        the caller owns and may sort or filter in place.
+        """
         with self._lock:
             return list(self._requests.values())
 
@@ -130,4 +197,7 @@ class RequestRegistry:
         with self._lock:
             self._requests.clear()
             self._path_index.clear()
+            for by_id in self._status_index.values():
+                by_id.clear()
+            self._pending_paths.clear()
             self._counter = 0
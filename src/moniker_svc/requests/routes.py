@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 
-from .loader import save_requests_to_yaml, load_requests_from_yaml
+from ..catalog.types import AuditEntry, CatalogNode, NodeStatus, Ownership
+from .loader import (
+    journal_path,
+    read_requests_from_yaml,
+)
 from .models import (
     CommentBody,
     MonikerRequestModel,
@@ -22,6 +27,7 @@ from .models import (
     SubmitRequestResponse,
 )
 from .registry import RequestRegistry
+from .save_context import AsyncSaveContext
 from .types import (
     DomainLevel,
     MonikerRequest,
@@ -33,17 +39,40 @@ from .types import (
 if TYPE_CHECKING:
     from ..catalog.registry import CatalogRegistry
     from ..domains.registry import DomainRegistry
+    from ..service import MonikerService
 
 logger = logging.getLogger(__name__)
 
+# Optional orjson for faster encoding of (large) request list responses.
+# Newer FastAPI versions deprecate ORJSONResponse because they serialize
+# response models straight to JSON bytes, which a custom response class
+# would disable - so only switch on versions without that fast path.
+try:
+    import orjson  # noqa: F401
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+_router_options = {}
+if ORJSON_AVAILABLE and not hasattr(ORJSONResponse, "__deprecated__"):
+    _router_options["default_response_class"] = ORJSONResponse
+
 # Create router
-router = APIRouter(prefix="/requests", tags=["Requests"])
+router = APIRouter(prefix="/requests", tags=["Requests"], **_router_options)
 
 # Configuration - set during app startup
 _request_registry: RequestRegistry | None = None
 _catalog_registry: "CatalogRegistry | None" = None
 _domain_registry: "DomainRegistry | None" = None
 _yaml_path: str | None = None
+_service: "MonikerService | None" = None
+
+# Batches auto-save writes; created when a YAML path is configured
+_save_context: AsyncSaveContext | None = None
+
+# Response models by request_id, tagged with the request version they were
+# built from (versions are unique per registry, so reset on configure)
+_model_cache: dict[str, tuple[int, MonikerRequestModel]] = {}
 
 
 def configure(
@@ -51,13 +80,17 @@ def configure(
     catalog_registry: "CatalogRegistry",
     domain_registry: "DomainRegistry | None" = None,
     yaml_path: str | None = None,
+    service: "MonikerService | None" = None,
 ) -> None:
     """Configure the request routes with registries."""
-    global _request_registry, _catalog_registry, _domain_registry, _yaml_path
+    global _request_registry, _catalog_registry, _domain_registry, _yaml_path, _service, _save_context
     _request_registry = request_registry
     _catalog_registry = catalog_registry
     _domain_registry = domain_registry
     _yaml_path = yaml_path
+    _service = service
+    _save_context = AsyncSaveContext(yaml_path, request_registry) if yaml_path else None
+    _model_cache.clear()
 
 
 def _get_registries():
@@ -67,20 +100,46 @@ def _get_registries():
     return _request_registry, _catalog_registry
 
 
-def _auto_save():
-    """Auto-save requests to YAML after mutations."""
-    if _yaml_path and _request_registry:
-        try:
-            save_requests_to_yaml(_yaml_path, _request_registry)
-        except Exception as e:
-            logger.error(f"Auto-save failed: {e}")
+def _invalidate_path(path: str) -> None:
+    """Drop the service's cached view of a path after a catalog change."""
+    if _service is not None:
+        _service.invalidate_path(path)
+
+
+def _auto_save(request: MonikerRequest | None):
+    """Auto-save a mutated request (batched by the save context when running)."""
+    if _save_context is None or request is None:
+        return
+    _save_context.mark_dirty(request)
+
+
+async def flush_autosave() -> None:
+    """Journal all pending request changes now."""
+    if _save_context is not None:
+        await _save_context.flush()
+
+
+def start_autosave() -> None:
+    """Start the background task that coalesces auto-save writes."""
+    if _save_context is not None:
+        _save_context.start()
+
+
+async def stop_autosave() -> None:
+    """Stop the background auto-save task and write anything still pending."""
+    if _save_context is not None:
+        await _save_context.stop()
 
 
 def _request_to_model(req: MonikerRequest) -> MonikerRequestModel:
-    """Convert a MonikerRequest to Pydantic response model."""
+    """Convert a MonikerRequest to Pydantic response model.
+
+    The source dataclasses are already validated, so the models are built
+    with ``model_construct`` to skip re-validating every field.
+    """
     requester = None
     if req.requester:
-        requester = RequesterResponseModel(
+        requester = RequesterResponseModel.model_construct(
             name=req.requester.name,
             email=req.requester.email,
             team=req.requester.team,
@@ -88,7 +147,7 @@ def _request_to_model(req: MonikerRequest) -> MonikerRequestModel:
         )
 
     comments = [
-        ReviewCommentModel(
+        ReviewCommentModel.model_construct(
             timestamp=c.timestamp,
             author=c.author,
             author_name=c.author_name,
@@ -98,7 +157,7 @@ def _request_to_model(req: MonikerRequest) -> MonikerRequestModel:
         for c in req.comments
     ]
 
-    return MonikerRequestModel(
+    return MonikerRequestModel.model_construct(
         request_id=req.request_id,
         path=req.path,
         display_name=req.display_name,
@@ -112,8 +171,10 @@ def _request_to_model(req: MonikerRequest) -> MonikerRequestModel:
         ads_name=req.ads_name,
         adal_name=req.adal_name,
         source_binding_type=req.source_binding_type,
-        source_binding_config=req.source_binding_config,
-        tags=req.tags,
+        # Copied, as validation would have, so the response doesn't share
+        # mutable state with the registry
+        source_binding_config=dict(req.source_binding_config),
+        tags=list(req.tags),
         status=req.status.value,
         domain_level=req.domain_level.value,
         comments=comments,
@@ -125,6 +186,16 @@ def _request_to_model(req: MonikerRequest) -> MonikerRequestModel:
     )
 
 
+def _cached_request_model(req: MonikerRequest) -> MonikerRequestModel:
+    """Response model for a request, rebuilt only when the request changed."""
+    cached = _model_cache.get(req.request_id)
+    if cached is not None and cached[0] == req.version:
+        return cached[1]
+    model = _request_to_model(req)
+    _model_cache[req.request_id] = (req.version, model)
+    return model
+
+
 # =============================================================================
 # UI Endpoint
 # =============================================================================
@@ -169,41 +240,39 @@ async def submit_request(body: SubmitRequestBody):
     """
     req_registry, cat_registry = _get_registries()
 
-    path = body.path.strip().strip("/")
-    if not path:
-        raise HTTPException(status_code=400, detail="Path cannot be empty")
+    path = body.path  # Normalized (and checked non-empty) by SubmitRequestBody
+
+    # Domain guard inputs: the first segment, and the immediate parent of a
+    # dot-notated single segment (e.g. "analytics" for "analytics.risk")
+    first_segment, slash, _ = path.partition("/")
+    parent_path = first_segment if slash else path.rpartition(".")[0]
+
+    # All catalog checks in one registry call
+    path_exists, parent_exists, first_segment_exists = cat_registry.exists_many(
+        (path, parent_path, first_segment)
+    )
 
     # Check if path already exists in catalog
-    if cat_registry.exists(path):
+    if path_exists:
         raise HTTPException(status_code=409, detail=f"Path already exists in catalog: {path}")
 
     # Check for duplicate pending request
     if req_registry.path_has_pending_request(path):
         raise HTTPException(status_code=409, detail=f"A pending request already exists for path: {path}")
 
-    # Domain guard: determine level and validate parent
-    segments = path.split("/")
-    # Also consider dot-separated top-level domains
-    top_level = segments[0].split(".")[0] if "." in segments[0] else segments[0]
-
-    if len(segments) == 1 and "." not in path:
+    if not slash and "." not in path:
         # Single segment, no dots = top-level domain request
         domain_level = DomainLevel.TOP_LEVEL
     else:
         domain_level = DomainLevel.SUB_PATH
-        # Verify parent path exists
-        parent_path = segments[0] if len(segments) > 1 else path.rsplit(".", 1)[0]
-        if not cat_registry.exists(parent_path):
-            # Try the full first segment (could be dot-notated)
-            if not cat_registry.exists(segments[0]):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Top-level domain '{segments[0]}' does not exist. Create it first.",
-                )
+        # Verify parent path exists (or the full, possibly dot-notated, first segment)
+        if not (parent_exists or first_segment_exists):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Top-level domain '{first_segment}' does not exist. Create it first.",
+            )
 
     # Create the catalog node with PENDING_REVIEW status
-    from ..catalog.types import CatalogNode, NodeStatus, Ownership
-
     ownership = Ownership(
         adop=body.adop,
         ads=body.ads,
@@ -222,6 +291,7 @@ async def submit_request(body: SubmitRequestBody):
         status=NodeStatus.PENDING_REVIEW,
     )
     cat_registry.register(node)
+    _invalidate_path(path)
 
     # Create the request
     requester = RequesterInfo(
@@ -252,7 +322,7 @@ async def submit_request(body: SubmitRequestBody):
     )
 
     request = req_registry.submit(request)
-    _auto_save()
+    _auto_save(request)
 
     level_msg = " (TOP-LEVEL domain - requires elevated review)" if domain_level == DomainLevel.TOP_LEVEL else ""
     return SubmitRequestResponse(
@@ -285,7 +355,7 @@ async def list_requests(status: str | None = None):
     requests.sort(key=lambda r: r.created_at or "", reverse=True)
 
     return RequestListResponse(
-        requests=[_request_to_model(r) for r in requests],
+        requests=[_cached_request_model(r) for r in requests],
         total=len(requests),
         by_status=req_registry.count_by_status(),
     )
@@ -329,7 +399,7 @@ async def approve_request(request_id: str, body: ReviewActionBody):
     now = datetime.now(timezone.utc).isoformat()
 
     # Update request status
-    req_registry.update_status(request_id, RequestStatus.APPROVED, actor=body.actor)
+    req_registry.update_status(request_id, RequestStatus.APPROVED, actor=body.actor, now=now)
 
     # Add approval comment
     comment = ReviewComment(
@@ -339,14 +409,13 @@ async def approve_request(request_id: str, body: ReviewActionBody):
         content=body.reason or "Approved",
         action="approve",
     )
-    req_registry.add_comment(request_id, comment)
+    req_registry.add_comment(request_id, comment, now=now)
 
     # Update catalog node: PENDING_REVIEW -> ACTIVE
-    from ..catalog.types import NodeStatus
-    cat_registry.update_status(request.path, NodeStatus.ACTIVE, actor=body.actor)
+    cat_registry.update_status(request.path, NodeStatus.ACTIVE, actor=body.actor, now=now)
+    _invalidate_path(request.path)
 
     # Add audit entry
-    from ..catalog.types import AuditEntry
     cat_registry.add_audit_entry(AuditEntry(
         timestamp=now,
         path=request.path,
@@ -355,10 +424,9 @@ async def approve_request(request_id: str, body: ReviewActionBody):
         details=f"Request {request_id} approved",
     ))
 
-    _auto_save()
-
     # Re-fetch for updated state
     updated = req_registry.get(request_id)
+    _auto_save(updated)
     return _request_to_model(updated)
 
 
@@ -388,6 +456,7 @@ async def reject_request(request_id: str, body: ReviewActionBody):
         request_id, RequestStatus.REJECTED,
         actor=body.actor,
         reason=body.reason,
+        now=now,
     )
 
     # Add rejection comment
@@ -398,14 +467,13 @@ async def reject_request(request_id: str, body: ReviewActionBody):
         content=body.reason or "Rejected",
         action="reject",
     )
-    req_registry.add_comment(request_id, comment)
+    req_registry.add_comment(request_id, comment, now=now)
 
     # Update catalog node: PENDING_REVIEW -> DRAFT
-    from ..catalog.types import NodeStatus
-    cat_registry.update_status(request.path, NodeStatus.DRAFT, actor=body.actor)
+    cat_registry.update_status(request.path, NodeStatus.DRAFT, actor=body.actor, now=now)
+    _invalidate_path(request.path)
 
     # Add audit entry
-    from ..catalog.types import AuditEntry
     cat_registry.add_audit_entry(AuditEntry(
         timestamp=now,
         path=request.path,
@@ -414,9 +482,8 @@ async def reject_request(request_id: str, body: ReviewActionBody):
         details=f"Request {request_id} rejected: {body.reason}",
     ))
 
-    _auto_save()
-
     updated = req_registry.get(request_id)
+    _auto_save(updated)
     return _request_to_model(updated)
 
 
@@ -438,10 +505,9 @@ async def add_comment(request_id: str, body: CommentBody):
         action="comment",
     )
 
-    req_registry.add_comment(request_id, comment)
-    _auto_save()
-
+    req_registry.add_comment(request_id, comment, now=now)
     updated = req_registry.get(request_id)
+    _auto_save(updated)
     return _request_to_model(updated)
 
 
@@ -451,13 +517,13 @@ async def add_comment(request_id: str, body: CommentBody):
 
 @router.post("/save")
 async def save_requests():
-    """Manually save requests to YAML."""
+    """Manually save a full YAML snapshot of requests (compacting the journal)."""
     req_registry, _ = _get_registries()
 
-    if not _yaml_path:
+    if not _yaml_path or _save_context is None:
         raise HTTPException(status_code=400, detail="No YAML path configured for requests")
 
-    count = save_requests_to_yaml(_yaml_path, req_registry)
+    count = await _save_context.save_snapshot(req_registry)
     return {"success": True, "count": count, "message": f"Saved {count} requests"}
 
 
@@ -469,9 +535,14 @@ async def reload_requests():
     if not _yaml_path:
         raise HTTPException(status_code=400, detail="No YAML path configured for requests")
 
-    if not Path(_yaml_path).exists():
+    if not Path(_yaml_path).exists() and not journal_path(_yaml_path).exists():
         raise HTTPException(status_code=404, detail=f"Requests file not found: {_yaml_path}")
 
+    # Don't lose changes that haven't reached the journal yet
+    await flush_autosave()
+    # Read and parse off the event loop, then swap the registry contents
+    loaded = await asyncio.to_thread(read_requests_from_yaml, _yaml_path)
     req_registry.clear()
-    loaded = load_requests_from_yaml(_yaml_path, req_registry)
+    _model_cache.clear()
+    req_registry.submit_many(loaded)
     return {"success": True, "count": len(loaded), "message": f"Reloaded {len(loaded)} requests"}
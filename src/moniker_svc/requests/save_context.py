@@ -0,0 +1,147 @@
+"""Coalesced background persistence for mutated moniker requests."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from pathlib import Path
+
+from .loader import (
+    append_journal_entries,
+    append_request_to_journal,
+    encode_journal_entries,
+    serialize_requests,
+    write_requests_yaml,
+)
+from .registry import RequestRegistry
+from .types import MonikerRequest
+
+logger = logging.getLogger(__name__)
+
+# How long mutations are collected before they are written out
+DEFAULT_SAVE_INTERVAL_SECONDS = 0.5
+
+# Journal entries written before the background task compacts the journal
+# into a fresh snapshot
+DEFAULT_COMPACT_AFTER_ENTRIES = 1000
+
+
+class AsyncSaveContext:
+    """
+    Journals mutated requests for a YAML file in batches.
+
+    Handlers call mark_dirty() after changing a request. While the
+    background task (see start) is running that only records the request,
+    so a burst of changes is written once per interval, off the event
+    loop. Without the task each change is written immediately.
+
+    Journal appends and full snapshots (save_snapshot) are serialized, so a
+    change journaled while a snapshot is being written can't be lost when
+    the snapshot truncates the journal. Given the registry, the background
+    task also compacts the journal into a snapshot once it has grown by
+    compact_after entries, so replay on startup stays short.
+    """
+
+    def __init__(
+        self,
+        yaml_path: str | Path,
+        registry: RequestRegistry | None = None,
+        interval_seconds: float = DEFAULT_SAVE_INTERVAL_SECONDS,
+        compact_after: int = DEFAULT_COMPACT_AFTER_ENTRIES,
+    ) -> None:
+        self.yaml_path = yaml_path
+        self.registry = registry
+        self.interval_seconds = interval_seconds
+        self.compact_after = compact_after
+        self._journaled = 0  # entries appended since the last snapshot
+        self._dirty: dict[str, MonikerRequest] = {}  # request_id -> latest state
+        self._task: asyncio.Task | None = None
+        self._stopping = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        """Whether the background save task is running."""
+        return self._task is not None
+
+    @property
+    def pending(self) -> int:
+        """Number of requests waiting to be written."""
+        return len(self._dirty)
+
+    def mark_dirty(self, request: MonikerRequest) -> None:
+        """Record that a request changed and needs to be saved."""
+        if self._task is not None or self._write_lock.locked():
+            self._dirty[request.request_id] = request
+            return
+        try:
+            append_request_to_journal(self.yaml_path, request)
+            self._journaled += 1
+        except Exception as e:
+            logger.error(f"Auto-save failed: {e}")
+
+    async def flush(self) -> None:
+        """Write all pending requests now."""
+        if not self._dirty:
+            return
+        async with self._write_lock:
+            if not self._dirty:
+                return  # Covered by a snapshot written meanwhile
+            # Encode on the event loop so handlers can't mutate a request mid-write
+            batch = self._dirty
+            self._dirty = {}
+            data = encode_journal_entries(batch.values())
+            try:
+                await asyncio.to_thread(append_journal_entries, self.yaml_path, data)
+                self._journaled += len(batch)
+            except Exception as e:
+                logger.error(f"Auto-save failed: {e}")
+                # Retry on the next flush; states marked during the write are newer
+                for request_id, request in batch.items():
+                    self._dirty.setdefault(request_id, request)
+
+    async def save_snapshot(self, registry: RequestRegistry) -> int:
+        """Write a full YAML snapshot of the registry, off the event loop.
+
+        Returns the number of requests saved.
+        """
+        async with self._write_lock:
+            # Everything pending is about to be part of the snapshot
+            self._dirty.clear()
+            records = serialize_requests(registry.all_requests())
+            await asyncio.to_thread(write_requests_yaml, self.yaml_path, records)
+            self._journaled = 0
+        logger.info(f"Saved {len(records)} requests to {self.yaml_path}")
+        # Changes made while the snapshot was written go to the new journal
+        if self._task is None:
+            await self.flush()
+        return len(records)
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+            if self.registry is not None and self._journaled >= self.compact_after:
+                try:
+                    await self.save_snapshot(self.registry)
+                except Exception as e:
+                    logger.error(f"Journal compaction failed: {e}")
+
+    def start(self) -> None:
+        """Start the background save task (requires a running event loop)."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background save task and write anything still pending."""
+        if self._task is not None:
+            # Let the task finish its current write rather than cancelling it
+            # while a worker thread is still appending to the files
+            self._stopping.set()
+            await self._task
+            self._task = None
+            self._stopping.clear()
+        await self.flush()
@@ -85,3 +85,6 @@ class MonikerRequest:
     # Timestamps
     created_at: str | None = None
     updated_at: str | None = None
+
+    # Bumped by the registry on every change, so derived views can be cached
+    version: int = field(default=0, compare=False)
@@ -12,16 +12,21 @@ Flow:
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import logging
+import random
+import re
 import time
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 from .cache.memory import InMemoryCache
 from .catalog.registry import CatalogRegistry
 from .catalog.types import CatalogNode, NodeStatus, ResolvedOwnership, SourceBinding
 from .config import Config
-from .dialect import get_dialect
+from .dialect import VersionDialect, get_dialect
 from .domains.registry import DomainRegistry
 from .moniker.parser import parse_moniker, MonikerParseError
 from .moniker.types import Moniker, VersionType
@@ -34,6 +39,123 @@ logger = logging.getLogger(__name__)
 # Maximum depth for successor redirect chains
 MAX_SUCCESSOR_DEPTH = 5
 
+# Unexpected resolve errors logged with a traceback per window; the rest
+# are counted and reported once the window has passed
+ERROR_LOG_BURST = 10
+ERROR_LOG_WINDOW_SECONDS = 1.0
+
+# Cached in place of a ResolveResult for paths with no source binding
+_NOT_FOUND = object()
+
+# Cache key kinds keyed by catalog path ("<kind>:<path>", or
+# "<kind>:<path>|<moniker>" for per-moniker entries), which
+# invalidate_path() evicts
+_PATH_CACHE_KINDS = frozenset({"resolve", "source", "meta", "lineage"})
+
+# Plain {name} placeholders understood by _format_template
+_SIMPLE_PLACEHOLDERS = (
+    "path", "version", "version_date", "revision", "namespace", "moniker",
+    "sub_resource", "version_type", "is_date", "is_latest", "is_lookback",
+    "is_frequency", "is_all", "lookback_value", "lookback_unit", "frequency",
+    "current_date", "lookback_start_sql", "is_tenor", "tenor_value", "tenor_unit",
+)
+
+# {is_*} flags and the version type each one tests for
+_VERSION_FLAGS = {
+    "is_date": VersionType.DATE,
+    "is_latest": VersionType.LATEST,
+    "is_lookback": VersionType.LOOKBACK,
+    "is_frequency": VersionType.FREQUENCY,
+    "is_all": VersionType.ALL,
+    "is_tenor": VersionType.LOOKBACK,  # Backward compatibility alias
+}
+
+# All placeholders understood by _format_template, matched in one pass:
+# {segments[N]}, {segments[N]:date}, {segment_date_sql[N]}, {is_all[N]},
+# {filter[N]:col}, {date_filter:col} and the simple names above
+_TEMPLATE_TOKEN_RE = re.compile(
+    r"\{(?:"
+    r"segments\[(\d+)\](:date)?"
+    r"|segment_date_sql\[(\d+)\]"
+    r"|is_all\[(\d+)\]"
+    r"|filter\[(\d+)\]:(\w+)"
+    r"|date_filter:(\w+)"
+    r"|(" + "|".join(_SIMPLE_PLACEHOLDERS) + r")"
+    r")\}"
+)
+
+
+# A compiled template: literal text and (kind, arg) placeholder tokens
+_TemplatePlan = tuple[str | tuple[str, Any], ...]
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(template: str) -> _TemplatePlan:
+    """
+    Split a template into literal text and placeholder tokens.
+
+    Literal text is kept as str; placeholders become (kind, arg) tuples,
+    where arg is a segment index, a column name, an (index, column) pair
+    or a simple placeholder name. Unknown placeholders stay literal text.
+    Cached, since the same binding templates are formatted on every resolve.
+    """
+    plan: list[str | tuple[str, Any]] = []
+    pos = 0
+    for match in _TEMPLATE_TOKEN_RE.finditer(template):
+        if match.start() > pos:
+            plan.append(template[pos:match.start()])
+        segment, as_date, segment_sql, is_all, filter_idx, filter_col, date_col, key = match.groups()
+        if segment is not None:
+            plan.append(("segment_date" if as_date else "segment", int(segment)))
+        elif segment_sql is not None:
+            plan.append(("segment_date_sql", int(segment_sql)))
+        elif is_all is not None:
+            plan.append(("is_all", int(is_all)))
+        elif filter_idx is not None:
+            plan.append(("filter", (int(filter_idx), filter_col)))
+        elif date_col is not None:
+            plan.append(("date_filter", date_col))
+        else:
+            plan.append(("key", key))
+        pos = match.end()
+    if pos < len(template):
+        plan.append(template[pos:])
+    return tuple(plan)
+
+
+@lru_cache(maxsize=16384)
+def _parse(moniker_str: str) -> Moniker:
+    """
+    parse_moniker, memoized by moniker string.
+
+    Traffic repeats the same monikers, and Moniker is immutable, so equal
+    strings share one instance along with its cached str/hash/hierarchy.
+    Parse errors are raised again on every call, not cached.
+    """
+    return parse_moniker(moniker_str)
+
+
+def _compile_binding_templates(config: dict[str, Any]) -> dict[str, _TemplatePlan]:
+    """
+    Compile every template string in a binding config, by template.
+
+    Covers nested dicts such as REST query_params. Kept with the cached
+    path resolution, so formatting its sources never depends on the
+    bounded _compile_template cache.
+    """
+    plans: dict[str, _TemplatePlan] = {}
+
+    def collect(value: Any) -> None:
+        if isinstance(value, str):
+            if "{" in value:
+                plans[value] = _compile_template(value)
+        elif isinstance(value, dict):
+            for item in value.values():
+                collect(item)
+
+    collect(config)
+    return plans
+
 
 class ResolutionError(Exception):
     """Raised when moniker resolution fails."""
@@ -53,7 +175,7 @@ class AccessDeniedError(ResolutionError):
         self.estimated_rows = estimated_rows
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ResolvedSource:
     """
     Result of resolving a moniker - tells client WHERE and HOW to get data.
@@ -84,7 +206,7 @@ class ResolvedSource:
     read_only: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolveResult:
     """Full resolution result including ownership and metadata."""
     moniker: str
@@ -103,7 +225,29 @@ class ResolveResult:
     redirected_from: str | None = None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class _PathMeta:
+    """Catalog lookups for a path, shared by resolve, list, describe and lineage."""
+    node: CatalogNode | None
+    ownership: ResolvedOwnership
+    # (binding, binding_path, binding_node), as from CatalogRegistry.resolve_bundle
+    binding_info: tuple[SourceBinding, str, CatalogNode] | None
+
+
+@dataclass(frozen=True, slots=True)
+class _PathResolution:
+    """The path-dependent part of a resolution, shared by every moniker on the path."""
+    binding: SourceBinding
+    binding_path: str
+    sub_path: str | None
+    redirected_from: str | None
+    ownership: ResolvedOwnership
+    node: CatalogNode | None
+    # Compiled binding templates, see _compile_binding_templates
+    plans: dict[str, _TemplatePlan]
+
+
+@dataclass(slots=True)
 class ListResult:
     """Result of a moniker list operation."""
     children: list[str]
@@ -112,7 +256,7 @@ class ListResult:
     ownership: ResolvedOwnership | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DescribeResult:
     """Result of a moniker describe operation."""
     node: CatalogNode | None
@@ -123,7 +267,162 @@ class DescribeResult:
     source_type: str | None = None
 
 
-@dataclass
+# =============================================================================
+# Source builders: (config, fmt) -> (connection, query, params) per source type
+# =============================================================================
+
+_Fmt = Callable[[str], str]
+_BuiltSource = tuple[dict[str, Any], str | None, dict[str, Any]]
+
+
+def _build_sql_query(config: dict[str, Any], fmt: _Fmt) -> str | None:
+    """Query for SQL sources: the query template, else SELECT * from the table."""
+    if config.get("query"):
+        return fmt(config["query"])
+    elif config.get("table"):
+        table = fmt(config["table"])
+        return f"SELECT * FROM {table}"
+    return None
+
+
+def _build_snowflake(config: dict[str, Any], fmt: _Fmt) -> _BuiltSource:
+    connection = {
+        "account": config.get("account"),
+        "warehouse": config.get("warehouse"),
+        "database": config.get("database"),
+        "schema": config.get("schema", "PUBLIC"),
+        "role": config.get("role"),
+    }
+    return connection, _build_sql_query(config, fmt), {}
+
+
+def _build_oracle(config: dict[str, Any], fmt: _Fmt) -> _BuiltSource:
+    connection = {
+        "dsn": config.get("dsn"),
+        "host": config.get("host"),
+        "port": config.get("port"),
+        "service_name": config.get("service_name"),
+    }
+    return connection, _build_sql_query(config, fmt), {}
+
+
+def _build_mssql(config: dict[str, Any], fmt: _Fmt) -> _BuiltSource:
+    connection = {
+        "server": config.get("server"),
+        "port": config.get("port", 1433),
+        "database": config.get("database"),
+        "driver": config.get("driver", "ODBC Driver 18 for SQL Server"),
+    }
+    return connection, _build_sql_query(config, fmt), {}
+
+
+def _build_rest(config: dict[str, Any], fmt: _Fmt) -> _BuiltSource:
+    connection = {
+        "base_url": config.get("base_url"),
+        "auth_type": config.get("auth_type", "none"),
+        "headers": config.get("headers", {}),
+    }
+    path_template = config.get("path_template", "/{path}")
+    params = {
+        "method": config.get("method", "GET"),
+        "response_path": config.get("response_path"),
+    }
+    # Format query_params if present
+    if config.get("query_params"):
+        params["query_params"] = {
+            k: fmt(v) for k, v in config["query_params"].items()
+        }
+    return connection, fmt(path_template), params
+
+
+def _build_static(config: dict[str, Any], fmt: _Fmt) -> _BuiltSource:
+    connection = {
+        "base_path": config.get("base_path", "."),
+    }
+    file_pattern = config.get("file_pattern", "{path}.json")
+    params = {
+        "format": config.get("format", "json"),
+        "encoding": config.get("encoding", "utf-8"),
+    }
+    return connection, fmt(file_pattern), params
+
+
+def _build_excel(config: dict[str, Any], fmt: _Fmt) -> _BuiltSource:
+    connection = {
+        "base_path": config.get("base_path", "."),
+    }
+    file_pattern = config.get("file_pattern", "{path}.xlsx")
+    params = {
+        "sheet": config.get("sheet"),
+        "header_row": config.get("header_row", 1),
+    }
+    return connection, fmt(file_pattern), params
+
+
+def _build_bloomberg(config: dict[str, Any], fmt: _Fmt) -> _BuiltSource:
+    connection = {
+        "host": config.get("host", "localhost"),
+        "port": config.get("port", 8194),
+        "api_type": config.get("api_type", "blpapi"),
+    }
+    securities = config.get("securities", "{path}")
+    params = {
+        "fields": config.get("fields", ["PX_LAST"]),
+        "securities": fmt(securities) if isinstance(securities, str) else securities,
+    }
+    return connection, None, params
+
+
+def _build_refinitiv(config: dict[str, Any], fmt: _Fmt) -> _BuiltSource:
+    connection = {
+        "api_type": config.get("api_type", "eikon"),
+    }
+    instruments = config.get("instruments", "{path}")
+    params = {
+        "fields": config.get("fields", []),
+        "instruments": fmt(instruments) if isinstance(instruments, str) else instruments,
+    }
+    return connection, None, params
+
+
+def _build_opensearch(config: dict[str, Any], fmt: _Fmt) -> _BuiltSource:
+    connection = {
+        "hosts": config.get("hosts", []),
+        "index": config.get("index"),
+    }
+    query = fmt(config["query"]) if config.get("query") else None
+    return connection, query, {}
+
+
+def _build_generic(config: dict[str, Any], fmt: _Fmt) -> _BuiltSource:
+    """Pass through config with template formatting."""
+    connection = {}
+    for k, v in config.items():
+        if k not in ("query", "table"):
+            connection[k] = fmt(v) if isinstance(v, str) else v
+    query = None
+    if config.get("query"):
+        query = fmt(config["query"])
+    elif config.get("table"):
+        query = fmt(config["table"])
+    return connection, query, {}
+
+
+# Source type -> builder; anything else goes through _build_generic
+_SOURCE_BUILDERS: dict[str, Callable[[dict[str, Any], _Fmt], _BuiltSource]] = {
+    "snowflake": _build_snowflake,
+    "oracle": _build_oracle,
+    "mssql": _build_mssql,
+    "rest": _build_rest,
+    "static": _build_static,
+    "excel": _build_excel,
+    "bloomberg": _build_bloomberg,
+    "refinitiv": _build_refinitiv,
+    "opensearch": _build_opensearch,
+}
+
+
+@dataclass(slots=True)
 class MonikerService:
     """
     Moniker Resolution Service.
@@ -146,8 +445,27 @@ class MonikerService:
     # Cache resolution results
     cache_enabled: bool = field(default=True, init=False)
 
+    # Follow successor chains of deprecated nodes on resolve
+    successor_redirect: bool = field(default=False, init=False)
+
+    # Fraction of successful resolutions that emit telemetry
+    telemetry_sample_rate: float = field(default=1.0, init=False)
+
+    # Dialects by source type, looked up once rather than per template
+    _dialects: dict[str, VersionDialect] = field(default_factory=dict, init=False, repr=False)
+
+    # Background re-resolution of hot paths after a catalog reload
+    _prewarm_task: asyncio.Task | None = field(default=None, init=False, repr=False)
+
+    # Unexpected-error log budget (see _error_log_allowed)
+    _error_window_start: float = field(default=0.0, init=False, repr=False)
+    _errors_logged: int = field(default=0, init=False, repr=False)
+    _errors_suppressed: int = field(default=0, init=False, repr=False)
+
     def __post_init__(self):
         self.cache_enabled = self.config.cache.enabled
+        self.successor_redirect = self.config.deprecation.enabled and self.config.deprecation.redirect_on_resolve
+        self.telemetry_sample_rate = self.config.telemetry.sample_rate
 
     async def resolve(
         self,
@@ -164,101 +482,48 @@ class MonikerService:
         outcome = EventOutcome.SUCCESS
         error_message: str | None = None
         result: ResolveResult | None = None
+        path_str: str | None = None
 
         try:
             # Parse moniker
-            moniker = parse_moniker(moniker_str)
+            moniker = _parse(moniker_str)
             path_str = str(moniker.path)
 
-            # Check cache for resolution
+            # Check cache for the path's resolution
             cache_key = f"resolve:{path_str}"
-            cached_result = None
+            resolution = None
             if self.cache_enabled:
-                cached_result = self.cache.get(cache_key)
-
-            if cached_result is not None:
-                # Rebuild result from cache
-                result = cached_result
-            else:
-                # Find source binding
-                binding_info = self.catalog.find_source_binding(path_str)
-                if binding_info is None:
-                    raise NotFoundError(f"No source binding for: {path_str}")
-
-                binding, binding_path = binding_info
-
-                # Successor redirect: if node is DEPRECATED with a successor,
-                # follow the successor chain to resolve the binding
-                # (only when deprecation feature is enabled)
-                redirected_from = None
-                deprecation_enabled = self.config.deprecation.enabled and self.config.deprecation.redirect_on_resolve
-                original_node = self.catalog.get(path_str)
-                if (deprecation_enabled
-                    and original_node
-                    and original_node.status == NodeStatus.DEPRECATED
-                    and original_node.successor):
-                    # Follow successor chain
-                    current_successor = original_node.successor
-                    redirected_from = path_str
-                    for _depth in range(MAX_SUCCESSOR_DEPTH):
-                        successor_binding = self.catalog.find_source_binding(current_successor)
-                        if successor_binding is None:
-                            logger.warning(f"Successor '{current_successor}' for '{path_str}' has no binding")
-                            break
-                        binding, binding_path = successor_binding
-                        # Check if the successor itself is deprecated with a further successor
-                        successor_node = self.catalog.get(current_successor)
-                        if (successor_node
-                            and successor_node.status == NodeStatus.DEPRECATED
-                            and successor_node.successor):
-                            current_successor = successor_node.successor
-                        else:
-                            break
-                    else:
-                        logger.warning(f"Successor chain for '{path_str}' exceeded max depth {MAX_SUCCESSOR_DEPTH}")
-
-                # Calculate sub-path (path relative to binding)
-                sub_path = None
-                if binding_path != path_str and path_str.startswith(binding_path):
-                    sub_path = path_str[len(binding_path):].lstrip("/")
-
-                # Check access policy
-                binding_node = self.catalog.get(binding_path)
-                if binding_node and binding_node.access_policy:
-                    segments = sub_path.split("/") if sub_path else []
-                    is_allowed, error_or_warning, estimated_rows = binding_node.access_policy.validate(segments)
-
-                    if not is_allowed:
-                        raise AccessDeniedError(error_or_warning or "Access denied by policy", estimated_rows)
-
-                    # Log warning if present
-                    if error_or_warning:
-                        logger.warning(f"Access policy warning for {path_str}: {error_or_warning}")
-
-                # Build resolved source
-                resolved_source = self._build_resolved_source(binding, moniker, sub_path)
-
-                # Resolve ownership (with domain fallback)
-                ownership = self.catalog.resolve_ownership(path_str, self.domain_registry)
-
-                # Get catalog node
-                node = self.catalog.get(path_str)
-
-                result = ResolveResult(
-                    moniker=moniker_str,
-                    path=path_str,
-                    source=resolved_source,
-                    ownership=ownership,
-                    node=node,
-                    binding_path=binding_path,
-                    sub_path=sub_path,
-                    redirected_from=redirected_from,
+                resolution = self.cache.get(cache_key)
+
+            if resolution is _NOT_FOUND:
+                raise NotFoundError(f"No source binding for: {path_str}")
+            elif resolution is None:
+                resolution = await self._build_path_resolution(path_str)
+
+            # Build resolved source. Templates depend on the whole moniker
+            # (version, revision, params, ...), so it is cached per moniker,
+            # keyed under its path for invalidate_path()
+            source_key = f"source:{path_str}|{moniker}"
+            resolved_source = None
+            if self.cache_enabled:
+                resolved_source = self.cache.get(source_key)
+            if resolved_source is None:
+                resolved_source = self._build_resolved_source(
+                    resolution.binding, moniker, resolution.sub_path, resolution.plans
                 )
-
-                # Cache the resolution
                 if self.cache_enabled:
-                    await self.cache.set(cache_key, result)
+                    await self.cache.set(source_key, resolved_source)
 
+            result = ResolveResult(
+                moniker=moniker_str,
+                path=path_str,
+                source=resolved_source,
+                ownership=resolution.ownership,
+                node=resolution.node,
+                binding_path=resolution.binding_path,
+                sub_path=resolution.sub_path,
+                redirected_from=resolution.redirected_from,
+            )
             return result
 
         except MonikerParseError as e:
@@ -277,7 +542,8 @@ class MonikerService:
         except Exception as e:
             outcome = EventOutcome.ERROR
             error_message = str(e)
-            logger.exception(f"Unexpected error in resolve: {e}")
+            if self._error_log_allowed():
+                logger.exception("Unexpected error in resolve: %s", e)
             raise
 
         finally:
@@ -285,6 +551,7 @@ class MonikerService:
             latency = (time.perf_counter() - start) * 1000
             self._emit_resolution_telemetry(
                 moniker_str=moniker_str,
+                moniker_path=path_str,
                 caller=caller,
                 outcome=outcome,
                 latency_ms=latency,
@@ -292,16 +559,153 @@ class MonikerService:
                 result=result,
             )
 
+    def _error_log_allowed(self) -> bool:
+        """
+        Whether another unexpected resolve error may be logged now.
+
+        Allows ERROR_LOG_BURST tracebacks per ERROR_LOG_WINDOW_SECONDS, so
+        a failing source can't flood the logs; errors over the budget are
+        counted and summarised when the next window starts.
+        """
+        now = time.monotonic()
+        if now - self._error_window_start >= ERROR_LOG_WINDOW_SECONDS:
+            if self._errors_suppressed:
+                logger.warning(f"Suppressed {self._errors_suppressed} unexpected resolve error logs")
+            self._error_window_start = now
+            self._errors_logged = 0
+            self._errors_suppressed = 0
+        if self._errors_logged < ERROR_LOG_BURST:
+            self._errors_logged += 1
+            return True
+        self._errors_suppressed += 1
+        return False
+
+    async def _build_path_resolution(self, path_str: str) -> _PathResolution:
+        """
+        Resolve a path's binding, redirect, sub-path and access policy, and cache it.
+
+        Called on a resolve:<path> cache miss. Raises NotFoundError (caching
+        the miss briefly) or AccessDeniedError.
+        """
+        cache_key = f"resolve:{path_str}"
+
+        # Find the node and its source binding in one catalog lookup
+        meta = await self._path_meta(path_str)
+        node, binding_info = meta.node, meta.binding_info
+        if binding_info is None:
+            # Remember the miss briefly, so repeated lookups skip the catalog
+            negative_ttl = self.config.cache.negative_ttl_seconds
+            if self.cache_enabled and negative_ttl > 0:
+                await self.cache.set(cache_key, _NOT_FOUND, ttl_seconds=negative_ttl)
+            raise NotFoundError(f"No source binding for: {path_str}")
+
+        binding, binding_path, binding_node = binding_info
+
+        # Successor redirect: if node is DEPRECATED with a successor,
+        # follow the successor chain to resolve the binding
+        # (only when deprecation feature is enabled)
+        redirected_from = None
+        if (self.successor_redirect
+            and node
+            and node.status == NodeStatus.DEPRECATED
+            and node.successor):
+            # Follow successor chain
+            current_successor = node.successor
+            redirected_from = path_str
+            for _depth in range(MAX_SUCCESSOR_DEPTH):
+                successor_node, successor_binding = self.catalog.resolve_bundle(current_successor)
+                if successor_binding is None:
+                    logger.warning(f"Successor '{current_successor}' for '{path_str}' has no binding")
+                    break
+                binding, binding_path, binding_node = successor_binding
+                # Check if the successor itself is deprecated with a further successor
+                if (successor_node
+                    and successor_node.status == NodeStatus.DEPRECATED
+                    and successor_node.successor):
+                    current_successor = successor_node.successor
+                else:
+                    break
+            else:
+                logger.warning(f"Successor chain for '{path_str}' exceeded max depth {MAX_SUCCESSOR_DEPTH}")
+
+        # Calculate sub-path (path relative to binding)
+        sub_path = None
+        if binding_path != path_str and path_str.startswith(binding_path):
+            sub_path = path_str[len(binding_path):].lstrip("/")
+
+        # Check access policy
+        if binding_node.access_policy:
+            segments = sub_path.split("/") if sub_path else []
+            is_allowed, error_or_warning, estimated_rows = binding_node.access_policy.validate(segments)
+
+            if not is_allowed:
+                raise AccessDeniedError(error_or_warning or "Access denied by policy", estimated_rows)
+
+            # Log warning if present
+            if error_or_warning:
+                logger.warning(f"Access policy warning for {path_str}: {error_or_warning}")
+
+        resolution = _PathResolution(
+            binding=binding,
+            binding_path=binding_path,
+            sub_path=sub_path,
+            redirected_from=redirected_from,
+            ownership=meta.ownership,
+            node=node,
+            plans=_compile_binding_templates(binding.config),
+        )
+
+        # Cache the resolution
+        if self.cache_enabled:
+            await self.cache.set(cache_key, resolution)
+        return resolution
+
+
+    async def _path_meta(self, path_str: str) -> _PathMeta:
+        """Get the node, ownership and source binding for a path (cached)."""
+        cache_key = f"meta:{path_str}"
+        if self.cache_enabled:
+            meta = self.cache.get(cache_key)
+            if meta is not None:
+                return meta
+
+        node, binding_info = self.catalog.resolve_bundle(path_str)
+        meta = _PathMeta(
+            node=node,
+            ownership=self.catalog.resolve_ownership(path_str, self.domain_registry),
+            binding_info=binding_info,
+        )
+        await self._cache_for_path(cache_key, meta, binding_info is not None)
+        return meta
+
+    async def _cache_for_path(self, key: str, value: Any, bound: bool) -> None:
+        """
+        Cache a value derived from a path's catalog state.
+
+        Values for paths without a source binding are kept only for
+        cache.negative_ttl_seconds, like other misses.
+        """
+        if not self.cache_enabled:
+            return
+        if bound:
+            await self.cache.set(key, value)
+        elif self.config.cache.negative_ttl_seconds > 0:
+            await self.cache.set(key, value, ttl_seconds=self.config.cache.negative_ttl_seconds)
+
     def _format_template(
         self,
         template: str,
         moniker: Moniker,
         sub_path: str | None,
         source_type: str = "snowflake",
+        plan: _TemplatePlan | None = None,
     ) -> str:
         """
         Format a template string with moniker components.
 
+        plan is the template's precompiled plan, if the caller has one;
+        otherwise the template is compiled (and cached) here.
+
         Supported placeholders:
             Raw values:
                 {path}              - Full sub-path after the binding
@@ -346,303 +750,181 @@ class MonikerService:
                                       "AAPL" → "col = 'AAPL'"
                 {is_all[N]}         - "true" if segment N is "ALL", else "false"
         """
-        import re
+        # Most binding values (accounts, table names, headers) are plain text
+        if "{" not in template:
+            return template
 
         path = sub_path or str(moniker.path)
-        segments = path.split("/") if path else []
         version = moniker.version or ""
 
         # Get dialect for this source type
-        dialect = get_dialect(source_type)
+        dialect = self._dialects.get(source_type)
+        if dialect is None:
+            dialect = self._dialects[source_type] = get_dialect(source_type)
 
-        # Compute version type flags
+        # Version type flags are only tested where a placeholder needs them
         version_type = moniker.version_type
-        is_date = version_type == VersionType.DATE
-        is_latest = version_type == VersionType.LATEST
-        is_lookback = version_type == VersionType.LOOKBACK
-        is_frequency = version_type == VersionType.FREQUENCY
-        is_all_version = version_type == VersionType.ALL
-
-        # Extract lookback components if applicable
-        lookback_value = ""
-        lookback_unit = ""
-        if is_lookback and moniker.version_lookback:
-            lookback_value = str(moniker.version_lookback[0])
-            lookback_unit = moniker.version_lookback[1]
 
-        # Extract frequency if applicable
-        frequency = moniker.version_frequency or ""
-
-        # Dialect-aware current date
-        current_date_sql = dialect.current_date()
+        # Extract lookback components, e.g. (3, "M") for @3M; None if not a lookback
+        lookback = moniker.version_lookback
+        lookback_value = str(lookback[0]) if lookback else ""
+        lookback_unit = lookback[1] if lookback else ""
 
         # SQL date translation using dialect
-        if not version:
-            version_date = current_date_sql
-        elif is_latest:
-            version_date = dialect.latest_subquery_hint()
-        elif is_date:
-            version_date = dialect.date_literal(version)
-        elif is_lookback and lookback_value and lookback_unit:
-            # For lookback, version_date returns the lookback start
-            version_date = dialect.lookback_start(int(lookback_value), lookback_unit)
-        else:
-            version_date = f"'{version}'"
-
-        # Generate lookback_start_sql
-        lookback_start_sql = ""
-        if is_lookback and lookback_value and lookback_unit:
-            lookback_start_sql = dialect.lookback_start(int(lookback_value), lookback_unit)
-
-        # Build substitution dict
-        subs = {
-            "path": path,
-            "version": version,
-            "version_date": version_date,
-            "revision": str(moniker.revision) if moniker.revision is not None else "",
-            "namespace": moniker.namespace or "",
-            "moniker": str(moniker),
-            "sub_resource": moniker.sub_resource or "",
-            # Version type placeholders
-            "version_type": version_type.value if version_type else "",
-            "is_date": "true" if is_date else "false",
-            "is_latest": "true" if is_latest else "false",
-            "is_lookback": "true" if is_lookback else "false",
-            "is_frequency": "true" if is_frequency else "false",
-            "is_all": "true" if is_all_version else "false",
-            # Lookback components
-            "lookback_value": lookback_value,
-            "lookback_unit": lookback_unit,
-            # Frequency
-            "frequency": frequency,
-            # Dialect-aware SQL
-            "current_date": current_date_sql,
-            "lookback_start_sql": lookback_start_sql,
-            # Backward compatibility aliases
-            "is_tenor": "true" if is_lookback else "false",
-            "tenor_value": lookback_value,
-            "tenor_unit": lookback_unit,
-        }
-
-        result = template
+        def version_date() -> str:
+            if not version:
+                return dialect.current_date()
+            elif version_type == VersionType.LATEST:
+                return dialect.latest_subquery_hint()
+            elif version_type == VersionType.DATE:
+                return dialect.date_literal(version)
+            elif lookback:
+                # For lookback, version_date returns the lookback start
+                return dialect.lookback_start(*lookback)
+            else:
+                return f"'{version}'"
+
+        # Simple placeholder values, computed on first use
+        def compute(key: str) -> str:
+            flag_type = _VERSION_FLAGS.get(key)
+            if flag_type is not None:
+                return "true" if version_type == flag_type else "false"
+            elif key == "path":
+                return path
+            elif key == "version":
+                return version
+            elif key == "version_date":
+                return version_date()
+            elif key == "revision":
+                return str(moniker.revision) if moniker.revision is not None else ""
+            elif key == "namespace":
+                return moniker.namespace or ""
+            elif key == "moniker":
+                return str(moniker)
+            elif key == "sub_resource":
+                return moniker.sub_resource or ""
+            elif key == "version_type":
+                return version_type.value if version_type else ""
+            elif key in ("lookback_value", "tenor_value"):
+                return lookback_value
+            elif key in ("lookback_unit", "tenor_unit"):
+                return lookback_unit
+            elif key == "frequency":
+                return moniker.version_frequency or ""
+            elif key == "current_date":
+                # Dialect-aware current date
+                return dialect.current_date()
+            else:  # lookback_start_sql
+                if lookback:
+                    return dialect.lookback_start(*lookback)
+                return ""
+
+        subs: dict[str, str] = {}
+
+        def lookup(key: str) -> str:
+            value = subs.get(key)
+            if value is None:
+                value = subs[key] = compute(key)
+            return value
+
+        # Path segments, split only if the template references one
+        segments: list[str] | None = None
+
+        def segment_at(idx: int) -> str | None:
+            nonlocal segments
+            if segments is None:
+                segments = path.split("/") if path else []
+            return segments[idx] if idx < len(segments) else None
 
         # Handle {segments[N]} patterns
-        def replace_segment(match: re.Match) -> str:
-            idx = int(match.group(1))
-            if 0 <= idx < len(segments):
-                return segments[idx]
-            return ""
-
-        result = re.sub(r"\{segments\[(\d+)\]\}", replace_segment, result)
+        def segment(idx: int) -> str:
+            seg = segment_at(idx)
+            return seg if seg is not None else ""
 
         # Handle {segments[N]:date} patterns - formats YYYYMMDD as YYYY-MM-DD
-        def replace_segment_date(match: re.Match) -> str:
-            idx = int(match.group(1))
-            if 0 <= idx < len(segments):
-                seg = segments[idx]
+        def segment_date(idx: int) -> str:
+            seg = segment_at(idx)
+            if seg is not None:
                 # Try to format as date if it looks like YYYYMMDD
                 if len(seg) == 8 and seg.isdigit():
                     return f"{seg[:4]}-{seg[4:6]}-{seg[6:8]}"
                 return seg  # Return as-is if not a date format
             return ""
 
-        result = re.sub(r"\{segments\[(\d+)\]:date\}", replace_segment_date, result)
-
         # Handle {segment_date_sql[N]} patterns - dialect-aware SQL date expression
-        def replace_segment_date_sql(match: re.Match) -> str:
-            idx = int(match.group(1))
-            if 0 <= idx < len(segments):
-                seg = segments[idx]
+        def segment_date_sql(idx: int) -> str:
+            seg = segment_at(idx)
+            if seg is not None:
                 if len(seg) == 8 and seg.isdigit():
                     return dialect.date_literal(seg)
                 return f"'{seg}'"  # Return as string literal if not a date
             return "NULL"
 
-        result = re.sub(r"\{segment_date_sql\[(\d+)\]\}", replace_segment_date_sql, result)
-
         # Handle {is_all[N]} patterns
-        def replace_is_all(match: re.Match) -> str:
-            idx = int(match.group(1))
-            if 0 <= idx < len(segments):
-                return "true" if segments[idx].upper() == "ALL" else "false"
+        def is_all(idx: int) -> str:
+            seg = segment_at(idx)
+            if seg is not None:
+                return "true" if seg.upper() == "ALL" else "false"
             return "false"
 
-        result = re.sub(r"\{is_all\[(\d+)\]\}", replace_is_all, result)
-
         # Handle {filter[N]:column} patterns - generates SQL WHERE clause fragment
-        def replace_filter(match: re.Match) -> str:
-            idx = int(match.group(1))
-            col = match.group(2)
-            if 0 <= idx < len(segments):
-                seg_value = segments[idx]
+        def segment_filter(arg: tuple[int, str]) -> str:
+            idx, col = arg
+            seg_value = segment_at(idx)
+            if seg_value is not None:
                 if seg_value.upper() == "ALL":
                     return dialect.no_filter()
                 else:
                     return f"{col} = '{seg_value}'"
             return dialect.no_filter()
 
-        result = re.sub(r"\{filter\[(\d+)\]:(\w+)\}", replace_filter, result)
-
         # Handle {date_filter:column} patterns - generates complete lookback WHERE clause
-        def replace_date_filter(match: re.Match) -> str:
-            col = match.group(1)
-            if is_lookback and lookback_value and lookback_unit:
-                return dialect.date_filter(col, int(lookback_value), lookback_unit)
-            elif is_all_version:
+        def date_filter(col: str) -> str:
+            if lookback:
+                return dialect.date_filter(col, *lookback)
+            elif version_type == VersionType.ALL:
                 return dialect.no_filter()
-            elif is_date:
-                return f"{col} = {version_date}"
+            elif version_type == VersionType.DATE:
+                return f"{col} = {lookup('version_date')}"
             else:
                 return dialect.no_filter()
 
-        result = re.sub(r"\{date_filter:(\w+)\}", replace_date_filter, result)
-
-        # Handle simple placeholders
-        for key, value in subs.items():
-            result = result.replace(f"{{{key}}}", value)
-
-        return result
+        handlers = {
+            "segment": segment,
+            "segment_date": segment_date,
+            "segment_date_sql": segment_date_sql,
+            "is_all": is_all,
+            "filter": segment_filter,
+            "date_filter": date_filter,
+            "key": lookup,
+        }
+        return "".join([
+            token if isinstance(token, str) else handlers[token[0]](token[1])
+            for token in (plan if plan is not None else _compile_template(template))
+        ])
 
     def _build_resolved_source(
         self,
         binding: SourceBinding,
         moniker: Moniker,
         sub_path: str | None,
+        plans: dict[str, _TemplatePlan] | None = None,
     ) -> ResolvedSource:
-        """Build the resolved source info from a binding."""
+        """Build the resolved source info from a binding.
+
+        plans holds the binding's precompiled templates, if available.
+        """
         config = binding.config
         source_type = binding.source_type.value
+        plans = plans or {}
 
         # Helper to format templates with SQL dialect awareness
         def fmt(template: str) -> str:
-            return self._format_template(template, moniker, sub_path, source_type)
+            return self._format_template(template, moniker, sub_path, source_type, plans.get(template))
 
         # Extract connection info (remove query/sensitive bits)
-        connection: dict[str, Any] = {}
-        query: str | None = None
-        params: dict[str, Any] = {}
-
-        if source_type == "snowflake":
-            connection = {
-                "account": config.get("account"),
-                "warehouse": config.get("warehouse"),
-                "database": config.get("database"),
-                "schema": config.get("schema", "PUBLIC"),
-                "role": config.get("role"),
-            }
-            # Build query
-            if config.get("query"):
-                query = fmt(config["query"])
-            elif config.get("table"):
-                table = fmt(config["table"])
-                query = f"SELECT * FROM {table}"
-
-        elif source_type == "oracle":
-            connection = {
-                "dsn": config.get("dsn"),
-                "host": config.get("host"),
-                "port": config.get("port"),
-                "service_name": config.get("service_name"),
-            }
-            if config.get("query"):
-                query = fmt(config["query"])
-            elif config.get("table"):
-                table = fmt(config["table"])
-                query = f"SELECT * FROM {table}"
-
-        elif source_type == "rest":
-            connection = {
-                "base_url": config.get("base_url"),
-                "auth_type": config.get("auth_type", "none"),
-                "headers": config.get("headers", {}),
-            }
-            path_template = config.get("path_template", "/{path}")
-            query = fmt(path_template)
-            params = {
-                "method": config.get("method", "GET"),
-                "response_path": config.get("response_path"),
-            }
-            # Format query_params if present
-            if config.get("query_params"):
-                params["query_params"] = {
-                    k: fmt(v) for k, v in config["query_params"].items()
-                }
-
-        elif source_type == "static":
-            connection = {
-                "base_path": config.get("base_path", "."),
-            }
-            file_pattern = config.get("file_pattern", "{path}.json")
-            query = fmt(file_pattern)
-            params = {
-                "format": config.get("format", "json"),
-                "encoding": config.get("encoding", "utf-8"),
-            }
-
-        elif source_type == "excel":
-            connection = {
-                "base_path": config.get("base_path", "."),
-            }
-            file_pattern = config.get("file_pattern", "{path}.xlsx")
-            query = fmt(file_pattern)
-            params = {
-                "sheet": config.get("sheet"),
-                "header_row": config.get("header_row", 1),
-            }
-
-        elif source_type == "bloomberg":
-            connection = {
-                "host": config.get("host", "localhost"),
-                "port": config.get("port", 8194),
-                "api_type": config.get("api_type", "blpapi"),
-            }
-            securities = config.get("securities", "{path}")
-            params = {
-                "fields": config.get("fields", ["PX_LAST"]),
-                "securities": fmt(securities) if isinstance(securities, str) else securities,
-            }
-
-        elif source_type == "refinitiv":
-            connection = {
-                "api_type": config.get("api_type", "eikon"),
-            }
-            instruments = config.get("instruments", "{path}")
-            params = {
-                "fields": config.get("fields", []),
-                "instruments": fmt(instruments) if isinstance(instruments, str) else instruments,
-            }
-
-        elif source_type == "mssql":
-            connection = {
-                "server": config.get("server"),
-                "port": config.get("port", 1433),
-                "database": config.get("database"),
-                "driver": config.get("driver", "ODBC Driver 18 for SQL Server"),
-            }
-            if config.get("query"):
-                query = fmt(config["query"])
-            elif config.get("table"):
-                table = fmt(config["table"])
-                query = f"SELECT * FROM {table}"
-
-        elif source_type == "opensearch":
-            connection = {
-                "hosts": config.get("hosts", []),
-                "index": config.get("index"),
-            }
-            if config.get("query"):
-                query = fmt(config["query"])
-
-        else:
-            # Generic - pass through config with template formatting
-            connection = {}
-            for k, v in config.items():
-                if k not in ("query", "table"):
-                    connection[k] = fmt(v) if isinstance(v, str) else v
-            if config.get("query"):
-                query = fmt(config["query"])
-            elif config.get("table"):
-                query = fmt(config["table"])
+        builder = _SOURCE_BUILDERS.get(source_type, _build_generic)
+        connection, query, params = builder(config, fmt)
 
         # Add moniker metadata to params
         params["moniker_version"] = moniker.version
@@ -651,7 +933,7 @@ class MonikerService:
 
         # Add moniker query params
         if moniker.params:
-            params["moniker_params"] = dict(moniker.params.params)
+            params["moniker_params"] = dict(moniker.params.items)
 
         return ResolvedSource(
             source_type=source_type,
@@ -671,31 +953,38 @@ class MonikerService:
         source_type: str | None = None,
         row_count: int | None = None,
         error_message: str | None = None,
+        moniker_path: str | None = None,
     ) -> None:
         """
         Record an access event from a client.
 
         Clients call this after fetching data to report telemetry.
+        moniker_path is the path from the client's resolve result, if it
+        sent one; otherwise it is parsed from moniker_str.
         """
-        try:
-            moniker = parse_moniker(moniker_str)
-            path_str = str(moniker.path)
-        except Exception:
-            path_str = moniker_str
-
-        ownership = self.catalog.resolve_ownership(path_str, self.domain_registry)
-
-        event = UsageEvent.create(
-            moniker=moniker_str,
-            moniker_path=path_str,
-            operation=Operation.READ,
-            caller=caller,
-            outcome=outcome,
-            latency_ms=latency_ms,
-            error_message=error_message,
-            resolved_source_type=source_type,
-            owner_at_access=ownership.accountable_owner,
-            result_count=row_count,
+        if moniker_path is not None:
+            path_str = moniker_path
+        else:
+            try:
+                moniker = _parse(moniker_str)
+                path_str = str(moniker.path)
+            except Exception:
+                path_str = moniker_str
+
+        # Clients report access right after resolving, so the path's
+        # ownership is usually still cached
+        ownership = (await self._path_meta(path_str)).ownership
+
+        event = UsageEvent.read_access(
+            moniker_str,
+            path_str,
+            caller,
+            outcome,
+            latency_ms,
+            error_message,
+            source_type,
+            ownership.accountable_owner,
+            row_count,
         )
 
         self.telemetry.emit(event)
@@ -709,9 +998,10 @@ class MonikerService:
         start = time.perf_counter()
         outcome = EventOutcome.SUCCESS
         error_message: str | None = None
+        path_str: str | None = None
 
         try:
-            moniker = parse_moniker(moniker_str)
+            moniker = _parse(moniker_str)
             path_str = str(moniker.path)
 
             # Get children from catalog only
@@ -719,15 +1009,15 @@ class MonikerService:
             catalog_children = self.catalog.children_paths(path_str)
 
             # Extract just the leaf names
-            children = [p.split("/")[-1] for p in catalog_children]
+            children = {p.rsplit("/", 1)[-1] for p in catalog_children}
 
-            ownership = self.catalog.resolve_ownership(path_str, self.domain_registry)
+            meta = await self._path_meta(path_str)
 
             return ListResult(
-                children=sorted(set(children)),
+                children=sorted(children),
                 moniker=moniker_str,
                 path=path_str,
-                ownership=ownership,
+                ownership=meta.ownership,
             )
 
         except MonikerParseError as e:
@@ -743,6 +1033,7 @@ class MonikerService:
             latency = (time.perf_counter() - start) * 1000
             self._emit_resolution_telemetry(
                 moniker_str=moniker_str,
+                moniker_path=path_str,
                 caller=caller,
                 outcome=outcome,
                 latency_ms=latency,
@@ -759,25 +1050,23 @@ class MonikerService:
         start = time.perf_counter()
         outcome = EventOutcome.SUCCESS
         error_message: str | None = None
+        path_str: str | None = None
 
         try:
-            moniker = parse_moniker(moniker_str)
+            moniker = _parse(moniker_str)
             path_str = str(moniker.path)
 
-            # Get catalog node
-            node = self.catalog.get(path_str)
-
-            # Resolve ownership (with domain fallback)
-            ownership = self.catalog.resolve_ownership(path_str, self.domain_registry)
+            # Catalog node, ownership (with domain fallback) and binding
+            meta = await self._path_meta(path_str)
 
             # Check if there's a source binding (but don't return details)
-            binding_info = self.catalog.find_source_binding(path_str)
+            binding_info = meta.binding_info
             has_binding = binding_info is not None
             source_type = binding_info[0].source_type.value if binding_info else None
 
             return DescribeResult(
-                node=node,
-                ownership=ownership,
+                node=meta.node,
+                ownership=meta.ownership,
                 moniker=moniker_str,
                 path=path_str,
                 has_source_binding=has_binding,
@@ -797,6 +1086,7 @@ class MonikerService:
             latency = (time.perf_counter() - start) * 1000
             self._emit_resolution_telemetry(
                 moniker_str=moniker_str,
+                moniker_path=path_str,
                 caller=caller,
                 outcome=outcome,
                 latency_ms=latency,
@@ -813,24 +1103,32 @@ class MonikerService:
         start = time.perf_counter()
         outcome = EventOutcome.SUCCESS
         error_message: str | None = None
+        path_str: str | None = None
 
         try:
-            moniker = parse_moniker(moniker_str)
+            moniker = _parse(moniker_str)
             path_str = str(moniker.path)
 
-            # Get ownership with provenance (with domain fallback)
-            ownership = self.catalog.resolve_ownership(path_str, self.domain_registry)
-
-            # Get binding info
-            binding_info = self.catalog.find_source_binding(path_str)
+            # The response depends only on the path, apart from the moniker.
+            # Callers get a deep copy, so they can't mutate the cached entry
+            cache_key = f"lineage:{path_str}"
+            lineage = self.cache.get(cache_key) if self.cache_enabled else None
+            if lineage is not None:
+                response = copy.deepcopy(lineage)
+                response["moniker"] = moniker_str
+                return response
+
+            # Get ownership with provenance (with domain fallback) and binding info
+            meta = await self._path_meta(path_str)
+            ownership = meta.ownership
             source_type = None
             source_binding_path = None
-            if binding_info:
-                binding, source_binding_path = binding_info
+            if meta.binding_info:
+                binding, source_binding_path, _ = meta.binding_info
                 source_type = binding.source_type.value
 
             # Build lineage response
-            return {
+            lineage = {
                 "moniker": moniker_str,
                 "path": path_str,
                 "ownership": {
@@ -863,10 +1161,10 @@ class MonikerService:
                     "type": source_type,
                     "binding_defined_at": source_binding_path,
                 },
-                "path_hierarchy": [str(moniker.path.root())] + [
-                    str(a) for a in moniker.path.ancestors()
-                ] + [path_str],
+                "path_hierarchy": list(moniker.path.hierarchy),
             }
+            await self._cache_for_path(cache_key, lineage, meta.binding_info is not None)
+            return copy.deepcopy(lineage)
 
         except Exception as e:
             outcome = EventOutcome.ERROR
@@ -877,6 +1175,7 @@ class MonikerService:
             latency = (time.perf_counter() - start) * 1000
             self._emit_resolution_telemetry(
                 moniker_str=moniker_str,
+                moniker_path=path_str,
                 caller=caller,
                 outcome=outcome,
                 latency_ms=latency,
@@ -893,13 +1192,20 @@ class MonikerService:
         error_message: str | None = None,
         result: ResolveResult | None = None,
         operation: Operation = Operation.READ,
+        moniker_path: str | None = None,
     ) -> None:
-        """Emit a resolution telemetry event (non-blocking)."""
-        try:
-            moniker = parse_moniker(moniker_str)
-            path_str = str(moniker.path)
-        except Exception:
-            path_str = moniker_str
+        """Emit a resolution telemetry event (non-blocking).
+
+        moniker_path is the caller's already-parsed path, None if the
+        moniker failed to parse. Successful resolutions are sampled at
+        telemetry.sample_rate; failures are always emitted.
+        """
+        if (outcome == EventOutcome.SUCCESS
+            and self.telemetry_sample_rate < 1.0
+            and random.random() >= self.telemetry_sample_rate):
+            return
+
+        path_str = moniker_path if moniker_path is not None else moniker_str
 
         # Extract deprecation info from result (only when feature enabled)
         deprecated = False
@@ -911,23 +1217,87 @@ class MonikerService:
                 successor = getattr(result.node, 'successor', None)
                 redirected_from = result.redirected_from
 
-        event = UsageEvent.create(
-            moniker=moniker_str,
-            moniker_path=path_str,
-            operation=operation,
-            caller=caller,
-            outcome=outcome,
-            latency_ms=latency_ms,
-            error_message=error_message,
-            resolved_source_type=result.source.source_type if result else None,
-            owner_at_access=result.ownership.accountable_owner if result else None,
-            metadata={"event_type": "resolution"},
-            deprecated=deprecated,
-            successor=successor,
-            redirected_from=redirected_from,
+        # Queue the event's fields; the emitter builds it off the request path
+        self.telemetry.emit_deferred(
+            UsageEvent.resolution,
+            time.time(),
+            moniker_str,
+            path_str,
+            operation,
+            caller,
+            outcome,
+            latency_ms,
+            error_message,
+            result.source.source_type if result else None,
+            result.ownership.accountable_owner if result else None,
+            deprecated,
+            successor,
+            redirected_from,
         )
 
-        self.telemetry.emit(event)
+    def _invalidate_cache(self) -> None:
+        """
+        Clear the cache after a catalog change, then prewarm it.
+
+        The paths most recently resolved before the clear are resolved
+        again against the new catalog in a background task, so the first
+        requests after a reload don't all miss.
+        """
+        limit = self.config.cache.prewarm_max_paths
+        prefix = "resolve:"
+        hot_paths: list[str] = []
+        if limit > 0:
+            hot_paths = [key[len(prefix):] for key in self.cache.recent_keys(prefix)[:limit]]
+        self.cache.clear_nowait()
+
+        if not (self.cache_enabled and hot_paths):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # No event loop (e.g. a script reloading the catalog)
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+        logger.info(f"Cache invalidated, prewarming {len(hot_paths)} paths")
+        self._prewarm_task = loop.create_task(self._prewarm(hot_paths))
+
+    def invalidate_path(self, path_str: str) -> int:
+        """
+        Evict cached entries for a path and its descendants.
+
+        For catalog changes to single nodes (e.g. the request workflow),
+        which can change the node, status, binding and ownership seen at
+        and below them. Returns the number of entries evicted.
+        """
+        descendant_prefixes = (path_str + "/", path_str + ".")
+
+        def affected(key: str) -> bool:
+            kind, sep, rest = key.partition(":")
+            key_path = rest.partition("|")[0]
+            return (
+                sep == ":"
+                and kind in _PATH_CACHE_KINDS
+                and (key_path == path_str or key_path.startswith(descendant_prefixes))
+            )
+
+        evicted = self.cache.delete_matching_nowait(affected)
+        if evicted:
+            logger.debug(f"Evicted {evicted} cache entries under {path_str}")
+        return evicted
+
+    async def _prewarm(self, paths: list[str]) -> None:
+        """Resolve paths into the cache, yielding to requests between paths."""
+        warmed = 0
+        for path_str in paths:
+            try:
+                await self._build_path_resolution(path_str)
+                warmed += 1
+            except ResolutionError:
+                pass  # Gone or now denied; the miss is cached as usual
+            except Exception as e:
+                logger.warning(f"Prewarming {path_str} failed: {e}")
+            await asyncio.sleep(0)
+        logger.info(f"Prewarmed {warmed} of {len(paths)} paths")
 
     def reload_catalog(
         self,
@@ -965,7 +1335,7 @@ class MonikerService:
             )
 
             if applied:
-                self.cache.clear()
+                self._invalidate_cache()
 
                 successor_errors = self.catalog.validate_successors()
                 if successor_errors:
@@ -990,7 +1360,7 @@ class MonikerService:
         else:
             # Original behaviour: plain atomic replace
             self.catalog.atomic_replace(new_nodes)
-            self.cache.clear()
+            self._invalidate_cache()
             logger.info(f"Catalog hot-reloaded with {len(new_nodes)} nodes")
             return {
                 "moniker_count": len(new_nodes),
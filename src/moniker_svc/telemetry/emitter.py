@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Any, Callable
 
 from .events import UsageEvent
 
@@ -23,6 +23,8 @@ class TelemetryEmitter:
 
     Features:
     - Non-blocking emit (fire and forget)
+    - Deferred emit: the event is built in the background from queued
+      factory arguments
     - Bounded queue with overflow policy
     - Metrics on queue depth and drops
     """
@@ -57,10 +59,13 @@ class TelemetryEmitter:
             # Process remaining events
             while not self._queue.empty():
                 try:
-                    event = self._queue.get_nowait()
-                    await self._deliver(event)
+                    item = self._queue.get_nowait()
+                    await self._deliver(self._build(item))
                 except asyncio.QueueEmpty:
                     break
+                except Exception as e:
+                    logger.error(f"Error processing telemetry event: {e}")
+                    self._stats["errors"] += 1
         logger.info(f"Telemetry emitter stopped. Stats: {self._stats}")
 
     def add_consumer(self, consumer: Callable[[UsageEvent], None]) -> None:
@@ -77,13 +82,30 @@ class TelemetryEmitter:
 
         Returns True if queued, False if dropped.
         """
+        return self._put(event)
+
+    def emit_deferred(self, factory: Callable[..., UsageEvent], *args: Any) -> bool:
+        """
+        Emit an event built later as factory(*args) (non-blocking).
+
+        Building an event (request id, timestamp, a 20-field frozen
+        dataclass) costs more than queueing it, so hot paths queue the
+        arguments and the processing loop calls the factory. Arguments
+        must not change after the call; capture timestamps up front.
+
+        Returns True if queued, False if dropped.
+        """
+        return self._put((factory, args))
+
+    def _put(self, item: UsageEvent | tuple) -> bool:
+        """Queue an event or a deferred (factory, args) pair."""
         if self._queue is None:
             logger.warning("Telemetry emitter not started, dropping event")
             self._stats["dropped"] += 1
             return False
 
         try:
-            self._queue.put_nowait(event)
+            self._queue.put_nowait(item)
             self._stats["emitted"] += 1
             return True
         except asyncio.QueueFull:
@@ -122,8 +144,8 @@ class TelemetryEmitter:
 
         while True:
             try:
-                event = await self._queue.get()
-                await self._deliver(event)
+                item = await self._queue.get()
+                await self._deliver(self._build(item))
                 self._queue.task_done()
             except asyncio.CancelledError:
                 logger.info("Telemetry processing loop cancelled")
@@ -132,6 +154,14 @@ class TelemetryEmitter:
                 logger.error(f"Error processing telemetry event: {e}")
                 self._stats["errors"] += 1
 
+    @staticmethod
+    def _build(item: UsageEvent | tuple) -> UsageEvent:
+        """Return the queued event, building it first if it was deferred."""
+        if isinstance(item, tuple):
+            factory, args = item
+            return factory(*args)
+        return item
+
     async def _deliver(self, event: UsageEvent) -> None:
         """Deliver event to all consumers."""
         for consumer in self._consumers:
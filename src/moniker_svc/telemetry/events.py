@@ -9,6 +9,11 @@ from enum import Enum
 from typing import Any
 
 
+# Metadata of every resolution event; one shared dict, so it must not be
+# mutated (a read-only mapping would not serialize with the sinks' json.dumps)
+_RESOLUTION_METADATA: dict[str, Any] = {"event_type": "resolution"}
+
+
 class EventOutcome(str, Enum):
     """Outcome of a moniker access."""
     SUCCESS = "success"
@@ -128,7 +133,7 @@ class UsageEvent:
     ) -> UsageEvent:
         """Factory method with sensible defaults."""
         # Extract domain from path
-        domain = moniker_path.split("/")[0] if "/" in moniker_path else moniker_path
+        domain = moniker_path.partition("/")[0]
 
         return cls(
             request_id=str(uuid.uuid4()),
@@ -143,6 +148,88 @@ class UsageEvent:
             **kwargs,
         )
 
+    @classmethod
+    def read_access(
+        cls,
+        moniker: str,
+        moniker_path: str,
+        caller: CallerIdentity,
+        outcome: EventOutcome,
+        latency_ms: float,
+        error_message: str | None,
+        resolved_source_type: str | None,
+        owner_at_access: str | None,
+        result_count: int | None,
+    ) -> UsageEvent:
+        """
+        Factory for client-reported READ events, one per data access.
+
+        Same result as create(), but passes fields positionally (in field
+        order) to skip the keyword dict on this hot path.
+        """
+        return cls(
+            str(uuid.uuid4()),
+            datetime.now(timezone.utc),
+            caller,
+            moniker,
+            moniker_path.partition("/")[0],
+            moniker_path,
+            Operation.READ,
+            outcome,
+            error_message,
+            latency_ms,
+            resolved_source_type,
+            None,  # resolved_source_path
+            owner_at_access,
+            result_count,
+        )
+
+    @classmethod
+    def resolution(
+        cls,
+        created_at: float,
+        moniker: str,
+        moniker_path: str,
+        operation: Operation,
+        caller: CallerIdentity,
+        outcome: EventOutcome,
+        latency_ms: float,
+        error_message: str | None,
+        resolved_source_type: str | None,
+        owner_at_access: str | None,
+        deprecated: bool,
+        successor: str | None,
+        redirected_from: str | None,
+    ) -> UsageEvent:
+        """
+        Factory for service-side resolution events.
+
+        Takes the request's time.time() rather than a datetime, so the
+        service can queue these arguments and leave building the event
+        to the emitter (see TelemetryEmitter.emit_deferred).
+        """
+        return cls(
+            str(uuid.uuid4()),
+            datetime.fromtimestamp(created_at, timezone.utc),
+            caller,
+            moniker,
+            moniker_path.partition("/")[0],
+            moniker_path,
+            operation,
+            outcome,
+            error_message,
+            latency_ms,
+            resolved_source_type,
+            None,  # resolved_source_path
+            owner_at_access,
+            None,  # result_count
+            False,  # cached
+            _RESOLUTION_METADATA,
+            deprecated,
+            successor,
+            redirected_from,
+        )
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -1,12 +1,21 @@
 """Tests for YAML round-trip persistence of moniker requests."""
 
+import asyncio
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from moniker_svc.requests.loader import load_requests_from_yaml, save_requests_to_yaml
+from moniker_svc.requests.loader import (
+    append_request_to_journal,
+    journal_path,
+    load_requests_from_yaml,
+    read_requests_from_yaml,
+    save_requests_to_yaml,
+)
+from moniker_svc.requests import save_context
 from moniker_svc.requests.registry import RequestRegistry
+from moniker_svc.requests.save_context import AsyncSaveContext
 from moniker_svc.requests.types import (
     DomainLevel,
     MonikerRequest,
@@ -108,6 +117,20 @@ class TestYAMLRoundTrip:
         assert reloaded_req2 is not None
         assert reloaded_req2.domain_level == DomainLevel.TOP_LEVEL
 
+    def test_reload_keeps_timestamps(self, tmp_path):
+        """Reloaded requests should keep their original timestamps."""
+        yaml_path = tmp_path / "requests.yaml"
+        registry = RequestRegistry()
+        req = registry.submit(MonikerRequest(request_id="", path="a", requester=_make_requester()))
+        save_requests_to_yaml(str(yaml_path), registry)
+
+        new_registry = RequestRegistry()
+        load_requests_from_yaml(str(yaml_path), new_registry)
+        reloaded = new_registry.get(req.request_id)
+        assert reloaded.created_at == req.created_at
+        assert reloaded.updated_at == req.updated_at
+        assert new_registry.path_has_pending_request("a")
+
     def test_load_missing_file(self, tmp_path):
         """Loading from a non-existent file should return empty list."""
         registry = RequestRegistry()
@@ -123,6 +146,22 @@ class TestYAMLRoundTrip:
         loaded = load_requests_from_yaml(str(yaml_path), registry)
         assert loaded == []
 
+    def test_load_tolerates_unknown_status(self, tmp_path):
+        """Records with unknown enum values should load with defaults."""
+        yaml_path = tmp_path / "requests.yaml"
+        yaml_path.write_text(
+            "requests:\n"
+            "  - request_id: REQ-0001\n"
+            "    path: a\n"
+            "    status: bogus\n"
+            "  - request_id: REQ-0002\n"
+            "    path: b\n"
+            "    status: approved\n"
+        )
+        registry = RequestRegistry()
+        loaded = load_requests_from_yaml(str(yaml_path), registry)
+        assert [r.status for r in loaded] == [RequestStatus.PENDING_REVIEW, RequestStatus.APPROVED]
+
     def test_save_creates_parent_dirs(self, tmp_path):
         """save should create parent directories if needed."""
         yaml_path = tmp_path / "nested" / "dir" / "requests.yaml"
@@ -138,6 +177,162 @@ class TestYAMLRoundTrip:
         assert yaml_path.exists()
 
 
+class TestJournal:
+    """Test the append-only journal kept alongside the YAML snapshot."""
+
+    def test_journal_replayed_over_snapshot(self, tmp_path):
+        """Journaled changes should win over the snapshot on reload."""
+        yaml_path = tmp_path / "requests.yaml"
+        registry = RequestRegistry()
+        req = registry.submit(MonikerRequest(request_id="", path="a", requester=_make_requester()))
+        save_requests_to_yaml(str(yaml_path), registry)
+
+        registry.update_status(req.request_id, RequestStatus.APPROVED, actor="reviewer@firm.com")
+        append_request_to_journal(str(yaml_path), req)
+        new_req = registry.submit(MonikerRequest(request_id="", path="b", requester=_make_requester()))
+        append_request_to_journal(str(yaml_path), new_req)
+
+        reloaded = RequestRegistry()
+        loaded = load_requests_from_yaml(str(yaml_path), reloaded)
+        assert len(loaded) == 2
+        assert reloaded.get_by_path("a").status == RequestStatus.APPROVED
+        assert reloaded.get_by_path("b").status == RequestStatus.PENDING_REVIEW
+
+    def test_journal_without_snapshot(self, tmp_path):
+        """A journal should load even before the first full save."""
+        yaml_path = tmp_path / "requests.yaml"
+        registry = RequestRegistry()
+        req = registry.submit(MonikerRequest(request_id="", path="a", requester=_make_requester()))
+        append_request_to_journal(str(yaml_path), req)
+
+        loaded = load_requests_from_yaml(str(yaml_path), RequestRegistry())
+        assert [r.path for r in loaded] == ["a"]
+
+    def test_save_truncates_journal(self, tmp_path):
+        """A full save should fold the journal into the snapshot."""
+        yaml_path = tmp_path / "requests.yaml"
+        registry = RequestRegistry()
+        req = registry.submit(MonikerRequest(request_id="", path="a", requester=_make_requester()))
+        append_request_to_journal(str(yaml_path), req)
+        assert journal_path(yaml_path).exists()
+
+        save_requests_to_yaml(str(yaml_path), registry)
+        assert not journal_path(yaml_path).exists()
+
+    def test_torn_line_skipped(self, tmp_path):
+        """A partially written final line should be ignored."""
+        yaml_path = tmp_path / "requests.yaml"
+        registry = RequestRegistry()
+        req = registry.submit(MonikerRequest(request_id="", path="a", requester=_make_requester()))
+        append_request_to_journal(str(yaml_path), req)
+        with open(journal_path(yaml_path), "ab") as f:
+            f.write(b'{"request_id": "REQ-0002", "pa')
+
+        loaded = load_requests_from_yaml(str(yaml_path), RequestRegistry())
+        assert [r.path for r in loaded] == ["a"]
+
+
+class TestAsyncSaveContext:
+    """Test batched background journaling of request changes."""
+
+    @pytest.mark.asyncio
+    async def test_changes_coalesced_until_flush(self, tmp_path):
+        """Repeated changes to a request should be journaled once per flush."""
+        yaml_path = tmp_path / "requests.yaml"
+        registry = RequestRegistry()
+        req = registry.submit(MonikerRequest(request_id="", path="a", requester=_make_requester()))
+
+        ctx = AsyncSaveContext(yaml_path, interval_seconds=3600)
+        ctx.start()
+        ctx.mark_dirty(req)
+        registry.update_status(req.request_id, RequestStatus.APPROVED, actor="reviewer@firm.com")
+        ctx.mark_dirty(req)
+        assert ctx.pending == 1
+        assert not journal_path(yaml_path).exists()
+
+        await ctx.stop()
+        assert ctx.pending == 0
+        assert len(journal_path(yaml_path).read_bytes().splitlines()) == 1
+        reloaded = RequestRegistry()
+        load_requests_from_yaml(yaml_path, reloaded)
+        assert reloaded.get_by_path("a").status == RequestStatus.APPROVED
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_retried(self, tmp_path, monkeypatch):
+        """Changes from a failed journal append should be written by the next flush."""
+        yaml_path = tmp_path / "requests.yaml"
+        registry = RequestRegistry()
+        req = registry.submit(MonikerRequest(request_id="", path="a", requester=_make_requester()))
+        other = registry.submit(MonikerRequest(request_id="", path="b", requester=_make_requester()))
+
+        append = save_context.append_journal_entries
+        ctx = AsyncSaveContext(yaml_path, interval_seconds=3600)
+
+        def fail(*args):
+            # A newer state of "a" is marked while the write is in flight
+            registry.update_status(req.request_id, RequestStatus.APPROVED, actor="reviewer@firm.com")
+            ctx.mark_dirty(req)
+            raise OSError("disk full")
+
+        monkeypatch.setattr(save_context, "append_journal_entries", fail)
+        ctx.start()
+        ctx.mark_dirty(req)
+        ctx.mark_dirty(other)
+        await ctx.flush()
+        assert ctx.pending == 2
+        assert not journal_path(yaml_path).exists()
+
+        monkeypatch.setattr(save_context, "append_journal_entries", append)
+        await ctx.stop()
+        assert ctx.pending == 0
+        reloaded = RequestRegistry()
+        load_requests_from_yaml(yaml_path, reloaded)
+        assert reloaded.get_by_path("a").status == RequestStatus.APPROVED
+        assert reloaded.get_by_path("b") is not None
+
+    @pytest.mark.asyncio
+    async def test_save_snapshot_truncates_journal(self, tmp_path):
+        """A snapshot should include pending changes and replace the journal."""
+        yaml_path = tmp_path / "requests.yaml"
+        registry = RequestRegistry()
+        req = registry.submit(MonikerRequest(request_id="", path="a", requester=_make_requester()))
+
+        ctx = AsyncSaveContext(yaml_path)
+        ctx.mark_dirty(req)
+        assert journal_path(yaml_path).exists()
+
+        assert await ctx.save_snapshot(registry) == 1
+        assert not journal_path(yaml_path).exists()
+        assert [r.path for r in read_requests_from_yaml(yaml_path)] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_background_compaction(self, tmp_path):
+        """The journal should be folded into a snapshot once it grows enough."""
+        yaml_path = tmp_path / "requests.yaml"
+        registry = RequestRegistry()
+        ctx = AsyncSaveContext(yaml_path, registry, interval_seconds=0.01, compact_after=2)
+        ctx.start()
+        for path in ("a", "b"):
+            ctx.mark_dirty(registry.submit(MonikerRequest(request_id="", path=path, requester=_make_requester())))
+
+        for _ in range(100):
+            await asyncio.sleep(0.01)
+            if yaml_path.exists():
+                break
+        await ctx.stop()
+        assert not journal_path(yaml_path).exists()
+        assert sorted(r.path for r in read_requests_from_yaml(yaml_path)) == ["a", "b"]
+
+    def test_writes_immediately_without_task(self, tmp_path):
+        """Without the background task each change is journaled right away."""
+        yaml_path = tmp_path / "requests.yaml"
+        registry = RequestRegistry()
+        req = registry.submit(MonikerRequest(request_id="", path="a", requester=_make_requester()))
+
+        AsyncSaveContext(yaml_path).mark_dirty(req)
+        assert journal_path(yaml_path).exists()
+
+
 class TestRegistryClear:
     """Test registry clear and counter reset."""
 
@@ -1,10 +1,14 @@
 """End-to-end tests for the moniker request & approval workflow."""
 
+from dataclasses import fields
+
 import pytest
 
 from moniker_svc.catalog.registry import CatalogRegistry
 from moniker_svc.catalog.types import CatalogNode, NodeStatus, Ownership
+from moniker_svc.requests.models import MonikerRequestModel, SubmitRequestBody
 from moniker_svc.requests.registry import RequestRegistry
+from moniker_svc.requests.routes import _request_to_model
 from moniker_svc.requests.types import (
     DomainLevel,
     MonikerRequest,
@@ -96,6 +100,31 @@ class TestSubmitRequest:
         assert req_registry.path_has_pending_request("market-data/prices") is True
         assert req_registry.path_has_pending_request("market-data/other") is False
 
+    def test_pending_cleared_after_review(self, req_registry):
+        """A reviewed request should no longer block its path."""
+        req = req_registry.submit(MonikerRequest(
+            request_id="",
+            path="market-data/prices",
+            requester=_make_requester(),
+        ))
+        req_registry.update_status(req.request_id, RequestStatus.REJECTED, actor="reviewer@firm.com")
+
+        assert req_registry.path_has_pending_request("market-data/prices") is False
+        assert req_registry.find_by_status(RequestStatus.PENDING_REVIEW) == []
+        assert req_registry.find_by_status(RequestStatus.REJECTED) == [req]
+
+
+class TestSubmitRequestBody:
+    """Tests for submission body validation."""
+
+    def test_path_normalized(self):
+        body = SubmitRequestBody(path="  /market-data/prices/ ", requester={"name": "a", "email": "a@firm.com"})
+        assert body.path == "market-data/prices"
+
+    def test_empty_path_rejected(self):
+        with pytest.raises(ValueError, match="Path cannot be empty"):
+            SubmitRequestBody(path=" / ", requester={"name": "a", "email": "a@firm.com"})
+
 
 class TestApproveReject:
     """Tests for approval and rejection flows."""
@@ -141,6 +170,24 @@ class TestApproveReject:
         node = catalog.get("market-data/bonds")
         assert node.status == NodeStatus.ACTIVE
 
+    def test_shared_review_timestamp(self, catalog, req_registry):
+        """A caller-supplied timestamp should be used for every related record."""
+        catalog.register(CatalogNode(path="market-data/bonds", status=NodeStatus.PENDING_REVIEW))
+        req = req_registry.submit(MonikerRequest(
+            request_id="",
+            path="market-data/bonds",
+            requester=_make_requester(),
+        ))
+
+        now = "2025-06-01T10:00:00+00:00"
+        req_registry.update_status(req.request_id, RequestStatus.APPROVED, actor="reviewer@firm.com", now=now)
+        req_registry.add_comment(req.request_id, ReviewComment(timestamp=now, author="reviewer@firm.com"), now=now)
+        node = catalog.update_status("market-data/bonds", NodeStatus.ACTIVE, actor="reviewer@firm.com", now=now)
+
+        assert req.reviewed_at == req.updated_at == now
+        assert node.updated_at == now
+        assert catalog.get_audit_log("market-data/bonds")[-1].timestamp == now
+
     def test_reject_updates_request_and_node(self, catalog, req_registry):
         """Rejecting should set request REJECTED and node DRAFT."""
         catalog.register(CatalogNode(
@@ -195,6 +242,19 @@ class TestComments:
         assert updated.comments[2].content == "Third"
         assert updated.comments[2].action == "approve"
 
+    def test_mutations_bump_version(self, req_registry):
+        """Every registry change should give the request a new version."""
+        req = req_registry.submit(MonikerRequest(
+            request_id="",
+            path="test-path",
+            requester=_make_requester(),
+        ))
+        v1 = req.version
+        req_registry.add_comment(req.request_id, ReviewComment(timestamp="t", author="a@firm.com"))
+        v2 = req.version
+        req_registry.update_status(req.request_id, RequestStatus.APPROVED, actor="a@firm.com")
+        assert 0 < v1 < v2 < req.version
+
 
 class TestCountsAndFiltering:
     """Tests for status counts and filtering."""
@@ -270,3 +330,25 @@ class TestOwnershipNameFields:
         roles = resolved.governance_roles
         assert roles["adop"]["name"] == "Jane Doe"
         assert roles["adop"]["value"] == "jane@firm.com"
+
+
+class TestResponseModel:
+    """Tests for converting requests to API response models."""
+
+    def test_model_fields_match_dataclass(self):
+        """Response models are built unvalidated, so their fields must not drift."""
+        dataclass_fields = {f.name for f in fields(MonikerRequest)} - {"version"}
+        assert set(MonikerRequestModel.model_fields) == dataclass_fields
+
+    def test_constructed_model_matches_validated(self, req_registry):
+        """The unvalidated model should equal one built through validation."""
+        req = req_registry.submit(MonikerRequest(
+            request_id="",
+            path="market-data/prices",
+            requester=_make_requester(),
+            tags=["prices"],
+        ))
+        req_registry.add_comment(req.request_id, ReviewComment(timestamp="t", author="a@firm.com"))
+
+        model = _request_to_model(req)
+        assert model == MonikerRequestModel.model_validate(model.model_dump())
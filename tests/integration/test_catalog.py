@@ -57,6 +57,10 @@ class TestCatalogRegistry:
         assert registry.exists("market-data")
         assert not registry.exists("nonexistent")
 
+    def test_exists_many(self, registry):
+        assert registry.exists_many(["nonexistent", "market-data"]) == [False, True]
+        assert registry.exists_many([]) == []
+
     def test_children(self, registry):
         children = registry.children("market-data")
         assert len(children) == 1
@@ -114,6 +118,18 @@ class TestSourceBinding:
         result = registry.find_source_binding("market-data")
         assert result is None
 
+    def test_resolve_bundle(self, registry):
+        node, binding_info = registry.resolve_bundle("market-data/prices/equity/AAPL")
+        assert node is None
+        binding, path, binding_node = binding_info
+        assert binding.source_type == SourceType.SNOWFLAKE
+        assert path == "market-data/prices/equity"
+        assert binding_node is registry.get("market-data/prices/equity")
+
+        node, binding_info = registry.resolve_bundle("market-data")
+        assert node is registry.get("market-data")
+        assert binding_info is None
+
 
 class TestAtomicReplace:
     def test_atomic_replace_all(self, registry):
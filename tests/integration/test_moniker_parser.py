@@ -3,11 +3,13 @@
 import pytest
 
 from moniker_svc.moniker.parser import (
+    build_moniker,
+    classify_version,
     parse_moniker,
     parse_path,
     MonikerParseError,
 )
-from moniker_svc.moniker.types import MonikerPath
+from moniker_svc.moniker.types import MonikerPath, VersionType
 
 
 class TestParsePath:
@@ -74,6 +76,18 @@ class TestMonikerPath:
         assert str(ancestors[1]) == "a/b"
         assert str(ancestors[2]) == "a/b/c"
 
+    def test_iter_ancestors(self):
+        path = MonikerPath(("a", "b", "c", "d"))
+        it = path.iter_ancestors()
+        assert str(next(it)) == "a"
+        assert [str(a) for a in it] == ["a/b", "a/b/c"]
+
+    def test_hierarchy(self):
+        path = MonikerPath(("a", "b", "c"))
+        assert path.hierarchy == ("", "a", "a/b", "a/b/c")
+        assert path.hierarchy is path.hierarchy
+        assert MonikerPath.root().hierarchy == ("", "")
+
     def test_child(self):
         path = MonikerPath(("market-data", "prices"))
         child = path.child("equity")
@@ -111,6 +125,20 @@ class TestParseMoniker:
         m = parse_moniker("moniker://path?version=v1")
         assert "version=v1" in str(m)
 
+    def test_params_canonical_order(self):
+        a = parse_moniker("path?b=2&a=1")
+        b = parse_moniker("path?a=1&b=2")
+        assert a == b
+        assert hash(a) == hash(b)
+        assert str(a) == "moniker://path?a=1&b=2"
+        assert "a" in a.params
+        assert a.params.get("missing") is None
+
+    def test_version_lookback(self):
+        assert parse_moniker("prices.equity/AAPL@3M").version_lookback == (3, "M")
+        assert parse_moniker("prices.equity/AAPL@12y").version_tenor == (12, "Y")
+        assert parse_moniker("prices.equity/AAPL@latest").version_lookback is None
+
     def test_empty_moniker(self):
         with pytest.raises(MonikerParseError):
             parse_moniker("")
@@ -118,3 +146,43 @@ class TestParseMoniker:
     def test_invalid_scheme(self):
         with pytest.raises(MonikerParseError):
             parse_moniker("http://market-data/prices")
+
+    def test_url_in_query_param_is_not_a_scheme(self):
+        m = parse_moniker("market-data/prices?source=http://example.com")
+        assert str(m.path) == "market-data/prices"
+        assert m.params.get("source") == "http://example.com"
+        assert str(m) == "moniker://market-data/prices?source=http://example.com"
+
+    def test_url_in_query_param_of_short_path(self):
+        m = parse_moniker("fx?u=http://x")
+        assert str(m.path) == "fx"
+        assert m.params.get("u") == "http://x"
+
+    def test_long_foreign_scheme_rejected(self):
+        with pytest.raises(MonikerParseError):
+            parse_moniker("my-custom-scheme+v2://market-data/prices")
+
+    def test_params_encoded_in_str(self):
+        m = build_moniker("market-data/prices", filter="a&b=c d#e")
+        assert str(m) == "moniker://market-data/prices?filter=a%26b%3Dc%20d%23e"
+        assert parse_moniker(str(m)) == m
+
+
+class TestClassifyVersion:
+    @pytest.mark.parametrize("version,expected", [
+        ("20260115", VersionType.DATE),
+        ("3M", VersionType.LOOKBACK),
+        ("12y", VersionType.LOOKBACK),
+        ("daily", VersionType.FREQUENCY),
+        ("Monthly", VersionType.FREQUENCY),
+        ("latest", VersionType.LATEST),
+        ("ALL", VersionType.ALL),
+        ("2026011", VersionType.CUSTOM),
+        ("rc1", VersionType.CUSTOM),
+    ])
+    def test_classification(self, version, expected):
+        assert classify_version(version) is expected
+
+    def test_empty(self):
+        assert classify_version(None) is None
+        assert classify_version("") is None
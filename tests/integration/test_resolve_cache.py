@@ -0,0 +1,385 @@
+"""Tests for caching of resolution results."""
+
+import pytest
+from starlette.requests import Request
+
+from moniker_svc import main
+from moniker_svc.catalog.registry import CatalogRegistry
+from moniker_svc.catalog.types import CatalogNode, NodeStatus, SourceBinding, SourceType
+from moniker_svc.domains import routes as domain_routes
+from moniker_svc.domains.models import CreateDomainRequest, UpdateDomainRequest
+from moniker_svc.domains.registry import DomainRegistry
+from moniker_svc.moniker.parser import MonikerParseError
+from moniker_svc.requests import routes as request_routes
+from moniker_svc.requests.models import RequesterModel, ReviewActionBody, SubmitRequestBody
+from moniker_svc.requests.registry import RequestRegistry
+from moniker_svc.service import ERROR_LOG_BURST, ERROR_LOG_WINDOW_SECONDS, NotFoundError, _parse
+from moniker_svc.telemetry.events import EventOutcome
+
+
+class TestNegativeCache:
+    @pytest.mark.asyncio
+    async def test_missing_binding_cached(self, service, caller):
+        with pytest.raises(NotFoundError):
+            await service.resolve("no-such-domain/thing", caller)
+
+        # Registered after the miss: still not found until the entry expires
+        service.catalog.register(CatalogNode(
+            path="no-such-domain",
+            source_binding=SourceBinding(source_type=SourceType.SNOWFLAKE, config={"table": "T"}),
+        ))
+        with pytest.raises(NotFoundError):
+            await service.resolve("no-such-domain/thing", caller)
+
+        await service.cache.clear()
+        result = await service.resolve("no-such-domain/thing", caller)
+        assert result.binding_path == "no-such-domain"
+
+    @pytest.mark.asyncio
+    async def test_disabled_with_zero_ttl(self, service, caller):
+        service.config.cache.negative_ttl_seconds = 0
+        with pytest.raises(NotFoundError):
+            await service.resolve("no-such-domain/thing", caller)
+        assert service.cache.size == 0
+
+
+class TestSourceCache:
+    @pytest.fixture(autouse=True)
+    def _prices(self, service):
+        service.catalog.register(CatalogNode(
+            path="cache-prices",
+            source_binding=SourceBinding(
+                source_type=SourceType.ORACLE,
+                config={"query": "SELECT * FROM P WHERE {filter[0]:sym} AND {date_filter:d}"},
+            ),
+        ))
+
+    @pytest.mark.asyncio
+    async def test_versions_on_same_path_resolve_separately(self, service, caller):
+        three_months = await service.resolve("cache-prices/AAPL@3M", caller)
+        one_year = await service.resolve("cache-prices/AAPL@1Y", caller)
+        assert "ADD_MONTHS(SYSDATE, -3)" in three_months.source.query
+        assert "ADD_MONTHS(SYSDATE, -12)" in one_year.source.query
+        assert one_year.moniker == "cache-prices/AAPL@1Y"
+
+    @pytest.mark.asyncio
+    async def test_equivalent_monikers_share_source(self, service, caller):
+        first = await service.resolve("cache-prices/AAPL@3M", caller)
+        second = await service.resolve("moniker://cache-prices/AAPL@3M", caller)
+        assert second.source is first.source
+        assert second.moniker == "moniker://cache-prices/AAPL@3M"
+
+
+class TestRecordAccess:
+    @pytest.mark.asyncio
+    async def test_ownership_from_resolution_cache(self, service, caller):
+        service.catalog.register(CatalogNode(
+            path="cached-domain",
+            source_binding=SourceBinding(source_type=SourceType.SNOWFLAKE, config={"table": "T"}),
+        ))
+        await service.resolve("cached-domain/thing", caller)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("ownership should come from the resolution cache")
+
+        service.catalog.resolve_ownership = fail
+        await service.record_access(
+            "cached-domain/thing", caller, EventOutcome.SUCCESS, 1.0,
+            moniker_path="cached-domain/thing",
+        )
+
+    @pytest.mark.asyncio
+    async def test_ownership_cached_without_resolve(self, service, caller):
+        service.catalog.register(CatalogNode(
+            path="reported-domain",
+            source_binding=SourceBinding(source_type=SourceType.SNOWFLAKE, config={"table": "T"}),
+        ))
+        await service.record_access("reported-domain/thing", caller, EventOutcome.SUCCESS, 1.0)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("ownership should be cached by the first report")
+
+        service.catalog.resolve_ownership = fail
+        await service.record_access("reported-domain/thing", caller, EventOutcome.SUCCESS, 1.0)
+
+
+class TestPathMeta:
+    @pytest.fixture(autouse=True)
+    def _node(self, service):
+        service.catalog.register(CatalogNode(
+            path="meta-domain",
+            source_binding=SourceBinding(source_type=SourceType.SNOWFLAKE, config={"table": "T"}),
+        ))
+
+    @pytest.mark.asyncio
+    async def test_lookups_shared_across_operations(self, service, caller):
+        await service.resolve("meta-domain/thing", caller)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("catalog lookups should come from the cache")
+
+        service.catalog.resolve_ownership = fail
+        service.catalog.resolve_bundle = fail
+        described = await service.describe("meta-domain/thing", caller)
+        lineage = await service.lineage("meta-domain/thing", caller)
+        assert described.source_type == "snowflake"
+        assert lineage["source"]["binding_defined_at"] == "meta-domain"
+        assert lineage["path_hierarchy"] == ["", "meta-domain", "meta-domain/thing"]
+
+    @pytest.mark.asyncio
+    async def test_lineage_cached_per_path(self, service, caller):
+        first = await service.lineage("meta-domain/thing", caller)
+
+        def fail(*args, **kwargs):
+            raise AssertionError("lineage should come from the cache")
+
+        await service.cache.delete("meta:meta-domain/thing")
+        service.catalog.resolve_ownership = fail
+        service.catalog.resolve_bundle = fail
+        second = await service.lineage("moniker://meta-domain/thing@latest", caller)
+        assert second["moniker"] == "moniker://meta-domain/thing@latest"
+        assert second["ownership"] == first["ownership"]
+
+    @pytest.mark.asyncio
+    async def test_lineage_response_not_shared_with_cache(self, service, caller):
+        first = await service.lineage("meta-domain/thing", caller)
+        first["ownership"]["accountable_owner"] = "mutated"
+        first["path_hierarchy"].append("mutated")
+
+        second = await service.lineage("meta-domain/thing", caller)
+        second["source"]["type"] = "mutated"
+        third = await service.lineage("meta-domain/thing", caller)
+        assert third["ownership"]["accountable_owner"] != "mutated"
+        assert third["path_hierarchy"] == ["", "meta-domain", "meta-domain/thing"]
+        assert third["source"]["type"] == "snowflake"
+
+    @pytest.mark.asyncio
+    async def test_reload_invalidates(self, service, caller):
+        assert (await service.describe("meta-domain", caller)).has_source_binding
+
+        new_catalog = CatalogRegistry()
+        new_catalog.register(CatalogNode(path="meta-domain"))
+        service.reload_catalog(new_catalog)
+
+        assert not (await service.describe("meta-domain", caller)).has_source_binding
+
+    @pytest.mark.asyncio
+    async def test_reload_prewarms_resolved_paths(self, service, caller):
+        await service.resolve("meta-domain/thing", caller)
+
+        new_catalog = CatalogRegistry()
+        new_catalog.register(CatalogNode(
+            path="meta-domain",
+            source_binding=SourceBinding(source_type=SourceType.ORACLE, config={"table": "T2"}),
+        ))
+        service.reload_catalog(new_catalog)
+        await service._prewarm_task
+
+        resolution = service.cache.get("resolve:meta-domain/thing")
+        assert resolution.binding.source_type == SourceType.ORACLE
+        result = await service.resolve("meta-domain/thing", caller)
+        assert result.source.query == "SELECT * FROM T2"
+
+
+class TestRequestInvalidation:
+    @pytest.fixture(autouse=True)
+    def _routes(self, service):
+        service.catalog.register(CatalogNode(
+            path="req-domain",
+            source_binding=SourceBinding(source_type=SourceType.SNOWFLAKE, config={"table": "T"}),
+        ))
+        request_routes.configure(
+            request_registry=RequestRegistry(),
+            catalog_registry=service.catalog,
+            service=service,
+        )
+
+    async def _submit(self, path: str) -> str:
+        response = await request_routes.submit_request(SubmitRequestBody(
+            path=path,
+            display_name="Requested",
+            requester=RequesterModel(name="Alice", email="alice@firm.com"),
+            adop="new-owner@firm.com",
+        ))
+        return response.request_id
+
+    @pytest.mark.asyncio
+    async def test_submit_and_review_visible_to_describe(self, service, caller):
+        assert (await service.describe("req-domain/new", caller)).node is None
+        await service.describe("req-domain/new/child", caller)
+
+        request_id = await self._submit("req-domain/new")
+        described = await service.describe("req-domain/new", caller)
+        assert described.node.display_name == "Requested"
+        assert described.node.status == NodeStatus.PENDING_REVIEW
+        child = await service.describe("req-domain/new/child", caller)
+        assert child.ownership.adop == "new-owner@firm.com"
+
+        await request_routes.approve_request(request_id, ReviewActionBody(actor="reviewer"))
+        described = await service.describe("req-domain/new", caller)
+        assert described.node.status == NodeStatus.ACTIVE
+
+    @pytest.mark.asyncio
+    async def test_submit_visible_to_lineage(self, service, caller):
+        before = await service.lineage("req-domain/new/child", caller)
+        assert before["governance_roles"]["adop"]["value"] is None
+
+        await self._submit("req-domain/new")
+        after = await service.lineage("req-domain/new/child", caller)
+        adop = after["governance_roles"]["adop"]
+        assert adop["value"] == "new-owner@firm.com"
+        assert adop["defined_at"] == "req-domain/new"
+
+    @pytest.mark.asyncio
+    async def test_sources_evicted_by_path(self, service, caller):
+        await service.resolve("req-domain/new/x@3M", caller)
+        await service.resolve("req-domain/newer/x@3M", caller)
+        await self._submit("req-domain/new")
+        assert service.cache.recent_keys("source:req-domain/new/") == []
+        assert service.cache.recent_keys("source:req-domain/newer/") != []
+
+    @pytest.mark.asyncio
+    async def test_other_paths_kept(self, service, caller):
+        await service.describe("req-domain/other", caller)
+        await service.describe("req-domain/newer", caller)
+        await self._submit("req-domain/new")
+        assert service.cache.get("meta:req-domain/other") is not None
+        assert service.cache.get("meta:req-domain/newer") is not None
+
+
+class TestStatusInvalidation:
+    @pytest.fixture(autouse=True)
+    def _node(self, service, monkeypatch):
+        service.catalog.register(CatalogNode(
+            path="status-domain",
+            source_binding=SourceBinding(source_type=SourceType.SNOWFLAKE, config={"table": "T"}),
+        ))
+        monkeypatch.setattr(main, "_service", service)
+
+    async def _set_status(self, path: str, **fields) -> None:
+        request = Request({
+            "type": "http", "method": "PUT", "path": f"/catalog/{path}/status",
+            "headers": [], "query_string": b"",
+        })
+        await main.update_catalog_status(
+            request, path, main.GovernanceStatusRequest(actor="steward", **fields),
+        )
+
+    @pytest.mark.asyncio
+    async def test_archive_visible_to_describe(self, service, caller):
+        assert (await service.describe("status-domain/thing", caller)).has_source_binding
+
+        await self._set_status("status-domain", status="archived")
+        described = await service.describe("status-domain/thing", caller)
+        assert not described.has_source_binding
+
+    @pytest.mark.asyncio
+    async def test_successor_visible_to_resolve(self, service, caller):
+        service.catalog.register(CatalogNode(
+            path="status-next",
+            source_binding=SourceBinding(source_type=SourceType.ORACLE, config={"table": "T2"}),
+        ))
+        service.successor_redirect = True
+        assert (await service.resolve("status-domain", caller)).redirected_from is None
+
+        await self._set_status("status-domain", status="deprecated", successor="status-next")
+        result = await service.resolve("status-domain", caller)
+        assert result.redirected_from == "status-domain"
+        assert result.binding_path == "status-next"
+        assert result.source.source_type == "oracle"
+
+
+    @pytest.mark.asyncio
+    async def test_archive_visible_to_lineage(self, service, caller):
+        before = await service.lineage("status-domain/thing", caller)
+        assert before["source"]["type"] == "snowflake"
+
+        await self._set_status("status-domain", status="archived")
+        after = await service.lineage("status-domain/thing", caller)
+        assert after["source"] == {"type": None, "binding_defined_at": None}
+
+
+class TestDomainInvalidation:
+    @pytest.fixture(autouse=True)
+    def _domains(self, service):
+        service.catalog.register(CatalogNode(
+            path="dom-domain",
+            source_binding=SourceBinding(source_type=SourceType.SNOWFLAKE, config={"table": "T"}),
+        ))
+        service.domain_registry = DomainRegistry()
+        domain_routes.configure(
+            domain_registry=service.domain_registry,
+            catalog_registry=service.catalog,
+            service=service,
+        )
+
+    async def _owner(self, service, caller) -> str | None:
+        return (await service.describe("dom-domain/thing", caller)).ownership.accountable_owner
+
+    @pytest.mark.asyncio
+    async def test_create_visible_to_describe(self, service, caller):
+        assert await self._owner(service, caller) is None
+        await domain_routes.create_domain(CreateDomainRequest(name="dom-domain", owner="exec@firm.com"))
+        assert await self._owner(service, caller) == "exec@firm.com"
+
+    @pytest.mark.asyncio
+    async def test_update_visible_to_describe(self, service, caller):
+        await domain_routes.create_domain(CreateDomainRequest(name="dom-domain", owner="exec@firm.com"))
+        assert await self._owner(service, caller) == "exec@firm.com"
+        await domain_routes.update_domain("dom-domain", UpdateDomainRequest(owner="new-exec@firm.com"))
+        assert await self._owner(service, caller) == "new-exec@firm.com"
+
+    @pytest.mark.asyncio
+    async def test_delete_visible_to_describe(self, service, caller):
+        await domain_routes.create_domain(CreateDomainRequest(name="dom-domain", owner="exec@firm.com"))
+        assert await self._owner(service, caller) == "exec@firm.com"
+        await domain_routes.delete_domain("dom-domain")
+        assert await self._owner(service, caller) is None
+
+    @pytest.mark.asyncio
+    async def test_update_visible_to_lineage(self, service, caller):
+        await domain_routes.create_domain(CreateDomainRequest(name="dom-domain", owner="exec@firm.com"))
+        await service.lineage("dom-domain/thing", caller)
+        await domain_routes.update_domain("dom-domain", UpdateDomainRequest(owner="new-exec@firm.com"))
+        lineage = await service.lineage("dom-domain/thing", caller)
+        assert lineage["ownership"]["accountable_owner"] == "new-exec@firm.com"
+        assert lineage["ownership"]["accountable_owner_defined_at"] == "domain:dom-domain"
+
+
+class TestParseCache:
+    def test_equal_strings_share_moniker(self):
+        assert _parse("prices/equity/AAPL@3M") is _parse("prices/equity/AAPL@3M")
+
+    def test_errors_not_cached(self):
+        for _ in range(2):
+            with pytest.raises(MonikerParseError):
+                _parse("bad path/with spaces")
+
+
+class TestTelemetrySampling:
+    @pytest.mark.asyncio
+    async def test_successes_sampled_failures_kept(self, service, caller):
+        await service.telemetry.start()
+        service.telemetry_sample_rate = 0.0
+        service.catalog.register(CatalogNode(
+            path="sampled-domain",
+            source_binding=SourceBinding(source_type=SourceType.SNOWFLAKE, config={"table": "T"}),
+        ))
+
+        await service.resolve("sampled-domain/thing", caller)
+        assert service.telemetry.stats["emitted"] == 0
+
+        with pytest.raises(NotFoundError):
+            await service.resolve("no-such-domain/thing", caller)
+        assert service.telemetry.stats["emitted"] == 1
+
+
+class TestErrorLogBudget:
+    def test_burst_then_suppressed(self, service, caplog):
+        allowed = [service._error_log_allowed() for _ in range(ERROR_LOG_BURST + 2)]
+        assert allowed == [True] * ERROR_LOG_BURST + [False, False]
+
+        # Next window: the suppressed count is reported and logging resumes
+        service._error_window_start -= ERROR_LOG_WINDOW_SECONDS
+        assert service._error_log_allowed()
+        assert "Suppressed 2 unexpected resolve error logs" in caplog.text
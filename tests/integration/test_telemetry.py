@@ -35,6 +35,52 @@ class TestUsageEvent:
         assert event.request_id is not None
         assert event.timestamp is not None
 
+    def test_read_access_matches_create(self, caller):
+        kwargs = dict(
+            error_message="boom",
+            resolved_source_type="oracle",
+            owner_at_access="owner@firm.com",
+            result_count=7,
+        )
+        created = UsageEvent.create(
+            moniker="moniker://market-data/prices",
+            moniker_path="market-data/prices",
+            operation=Operation.READ,
+            caller=caller,
+            outcome=EventOutcome.ERROR,
+            latency_ms=3.0,
+            **kwargs,
+        )
+        event = UsageEvent.read_access(
+            "moniker://market-data/prices", "market-data/prices", caller,
+            EventOutcome.ERROR, 3.0, *kwargs.values(),
+        )
+
+        expected = created.to_dict()
+        actual = event.to_dict()
+        for key in ("request_id", "timestamp"):
+            del expected[key], actual[key]
+        assert actual == expected
+        assert event.moniker_domain == "market-data"
+
+    def test_resolution_event(self, caller):
+        event = UsageEvent.resolution(
+            0.0, "market-data/prices@3M", "market-data/prices", Operation.DESCRIBE, caller,
+            EventOutcome.SUCCESS, 2.0, None, "snowflake", "owner@firm.com",
+            True, "market-data/prices-v2", None,
+        )
+        assert event.timestamp.isoformat() == "1970-01-01T00:00:00+00:00"
+        assert event.operation == Operation.DESCRIBE
+        assert event.moniker_domain == "market-data"
+        assert event.metadata == {"event_type": "resolution"}
+        other = UsageEvent.resolution(
+            0.0, "other", "other", Operation.READ, caller,
+            EventOutcome.ERROR, 1.0, "boom", None, None, False, None, None,
+        )
+        assert other.metadata is event.metadata
+        assert event.deprecated
+        assert event.successor == "market-data/prices-v2"
+
     def test_to_dict(self, caller):
         event = UsageEvent.create(
             moniker="moniker://test",
@@ -96,6 +142,44 @@ class TestTelemetryEmitter:
 
         await emitter.stop()
 
+    @pytest.mark.asyncio
+    async def test_emit_deferred(self, caller):
+        emitter = TelemetryEmitter()
+        await emitter.start()
+
+        received = []
+        emitter.add_consumer(lambda e: received.append(e))
+
+        assert emitter.emit_deferred(
+            UsageEvent.create, "test", "test", Operation.READ, caller, EventOutcome.SUCCESS,
+        )
+        assert emitter.stats["emitted"] == 1
+
+        # Built when delivered
+        await emitter.stop()
+        assert len(received) == 1
+        assert received[0].moniker == "test"
+
+    @pytest.mark.asyncio
+    async def test_stop_drains_past_failed_event(self, caller):
+        emitter = TelemetryEmitter()
+        await emitter.start()
+
+        received = []
+        emitter.add_consumer(lambda e: received.append(e))
+
+        def fail(*args):
+            raise ValueError("bad event")
+
+        emitter.emit_deferred(fail)
+        emitter.emit_deferred(
+            UsageEvent.create, "test", "test", Operation.READ, caller, EventOutcome.SUCCESS,
+        )
+
+        await emitter.stop()
+        assert emitter.stats["errors"] == 1
+        assert len(received) == 1
+
     @pytest.mark.asyncio
     async def test_queue_overflow(self, caller):
         emitter = TelemetryEmitter(max_queue_size=2)
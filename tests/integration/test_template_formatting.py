@@ -0,0 +1,85 @@
+"""Tests for source binding template formatting."""
+
+from moniker_svc.moniker.parser import parse_moniker
+from moniker_svc.service import _compile_binding_templates, _compile_template
+
+
+class TestCompileTemplate:
+    def test_literal_only(self):
+        assert _compile_template("EQUITY_PRICES") == ("EQUITY_PRICES",)
+
+    def test_indexed_placeholders(self):
+        plan = _compile_template("{segments[0]}/{segments[1]:date} WHERE {filter[2]:sym} AND {date_filter:asof}")
+        assert plan == (
+            ("segment", 0),
+            "/",
+            ("segment_date", 1),
+            " WHERE ",
+            ("filter", (2, "sym")),
+            " AND ",
+            ("date_filter", "asof"),
+        )
+
+    def test_simple_placeholders(self):
+        assert _compile_template("{path}.json?v={version}&x={unknown}") == (
+            ("key", "path"),
+            ".json?v=",
+            ("key", "version"),
+            "&x={unknown}",
+        )
+
+    def test_malformed_placeholders_left_as_text(self):
+        assert _compile_template("{segments[a]}{filter[0]}") == ("{segments[a]}{filter[0]}",)
+
+
+class TestCompileBindingTemplates:
+    def test_collects_nested_templates(self):
+        plans = _compile_binding_templates({
+            "base_url": "https://api.example.com",
+            "path_template": "/v1/{path}",
+            "query_params": {"from": "{version}", "format": "json"},
+            "timeout": 30,
+        })
+        assert plans == {
+            "/v1/{path}": ("/v1/", ("key", "path")),
+            "{version}": (("key", "version"),),
+        }
+
+
+class TestFormatTemplate:
+    def test_segments_and_filters(self, service):
+        moniker = parse_moniker("prices/equity/ALL/20260115@3M")
+        result = service._format_template(
+            "SELECT * FROM {segments[0]} WHERE {filter[1]:sym} AND d = {segments[2]:date} AND {is_all[1]}",
+            moniker,
+            "equity/ALL/20260115",
+        )
+        assert result == "SELECT * FROM equity WHERE 1=1 AND d = 2026-01-15 AND true"
+
+    def test_out_of_range_segments(self, service):
+        moniker = parse_moniker("prices/equity")
+        result = service._format_template(
+            "[{segments[5]}] {filter[5]:sym} {segment_date_sql[5]} {is_all[5]}",
+            moniker,
+            "equity",
+        )
+        assert result == "[] 1=1 NULL false"
+
+    def test_lookback_date_filter(self, service):
+        moniker = parse_moniker("prices/equity@3M")
+        result = service._format_template("{date_filter:asof}", moniker, "equity", "oracle")
+        assert result == "asof >= ADD_MONTHS(SYSDATE, -3)"
+
+    def test_simple_placeholders(self, service):
+        moniker = parse_moniker("prices/equity@20260101")
+        result = service._format_template("{path}|{version}|{is_date}|{unknown}", moniker, "equity")
+        assert result == "equity|20260101|true|{unknown}"
+
+    def test_precompiled_plan_used(self, service):
+        moniker = parse_moniker("prices/equity")
+        plan = (("key", "path"), "!")
+        assert service._format_template("{path}", moniker, "equity", plan=plan) == "equity!"
+
+    def test_plain_text_returned_unchanged(self, service):
+        template = "FIRM.US-EAST-1"
+        assert service._format_template(template, parse_moniker("prices/equity"), "equity") is template